@@ -0,0 +1,339 @@
+import argparse
+import contextlib
+import csv
+import io
+import json
+import multiprocessing
+import os
+import queue
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is not reported
+    resource = None
+
+BASELINE_FILE = 'benchmark_baseline.json'
+DEFAULT_SIZES = (100, 1000, 10000)
+# Seconds a single stage may run before its worker is killed and the stage recorded as failed
+DEFAULT_STAGE_TIMEOUT = 900
+
+# Same header row as 'FY26_27 Me@Sams_timeline dashboard.csv' (including the trailing space)
+CSV_HEADERS = [
+    'Product Item Name', 'Item Type', 'Open Product Brief (PPT)', 'Product Development Life Cycle Stage',
+    'Product Manager', 'Product Leader ', 'PPD Priority', 'Product Group', 'Product',
+    'Proposed Roadmap (Launch) FY QTR',
+]
+ITEM_TYPES = ['Enhancement', 'New Capability', 'Expansion', 'TBD']
+LIFECYCLE_STAGES = ['Backlog', 'Discovery', 'Design', 'Awaiting Design', 'Awaiting Dev Start', 'Build',
+                    'Launch: Pilot', 'Launch: Beta', 'Live', 'New: To be reviewed', 'Plan (Pre-Discovery)']
+PRIORITIES = ['Strategic (P0)', 'Key Initiative (P1)', 'Significant (P2)', 'Important (P3)', 'Supportive (P4)', '']
+GROUPS = ['Well-being', 'Talent & Learning', 'Global Time & Attendance (GTA)', 'Unified Experiences',
+          'Me@Core', 'Support & Insights', 'Recruiting & Onboarding', 'AI']
+PRODUCTS = ['Total Pay & Benefits', 'Translation', 'Preboard/Onboard', 'Performance & Pay', 'Associate Listening',
+            'Platform: Containers (Me@Campus/Me@Sams/Enterprise Web)', 'Time & Attendance', 'Learning']
+QUARTER_SPELLINGS = ['FY{yyyy} Q{q}', 'FY{yy} Q{q}', 'FY{yy}-Q{q}', 'Q{q} FY{yy}']
+
+
+def generate_roadmap_csv(path, n_rows, seed=0):
+    """Write a synthetic roadmap export with the real CSV schema and value mix"""
+    rng = random.Random(seed)
+    managers = [f"Manager {i}" for i in range(max(10, n_rows // 50))]
+    leaders = [f"Leader {i}" for i in range(max(4, n_rows // 500))]
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADERS)
+        for i in range(n_rows):
+            fy = rng.choice((2026, 2027))
+            quarter = rng.choice(QUARTER_SPELLINGS).format(yyyy=fy, yy=fy % 100, q=rng.randint(1, 4))
+            writer.writerow([
+                f"{rng.choice(PRODUCTS)}: roadmap item {i}",
+                rng.choice(ITEM_TYPES),
+                '',
+                rng.choice(LIFECYCLE_STAGES),
+                rng.choice(managers),
+                rng.choice(leaders),
+                rng.choice(PRIORITIES),
+                rng.choice(GROUPS),
+                rng.choice(PRODUCTS),
+                quarter if rng.random() > 0.01 else '',
+            ])
+    return path
+
+
+def _read_export(csv_path):
+    import pandas as pd
+    return pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+
+
+def _bench_parse_quarter(csv_path, work_dir):
+    from quarter_parser import parse_quarter_series
+    quarters = _read_export(csv_path)['Proposed Roadmap (Launch) FY QTR']
+    return lambda: (parse_quarter_series(quarters), 0)[1]
+
+
+def _bench_identify_columns(csv_path, work_dir):
+    import schema_inference
+    from data_converter import identify_columns
+    df = _read_export(csv_path)
+
+    def run():
+        # Time the inference itself, not a lookup in the schema cache of an earlier run
+        schema_inference._memory_cache.clear()
+        with contextlib.redirect_stdout(io.StringIO()):
+            identify_columns(df, cache_file=None)
+        return 0
+    return run
+
+
+def _bench_convert_csv_to_js(csv_path, work_dir):
+    from build_cache import BuildCache
+    from convert_csv import convert_csv_to_js
+    out = os.path.join(work_dir, 'roadmap_data.js')
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            convert_csv_to_js(csv_path, out, cache=BuildCache(enabled=False))
+        return os.path.getsize(out)
+    return run
+
+
+def _bench_create_timeline_chart(csv_path, work_dir):
+    import matplotlib
+    matplotlib.use('Agg')
+    from roadmap_visualizer import RoadmapVisualizer
+    out = os.path.join(work_dir, 'roadmap_timeline.png')
+    visualizer = RoadmapVisualizer()
+
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            fig = visualizer.create_timeline_chart(csv_path)
+        fig.savefig(out, dpi=visualizer.dpi, bbox_inches='tight')
+        return os.path.getsize(out)
+    return run
+
+
+# stage -> setup(csv_path, work_dir) returning the timed callable; imports and
+# input loading happen in setup so wall time covers only the stage itself
+STAGE_SETUP = {
+    'parse_quarter': _bench_parse_quarter,
+    'identify_columns': _bench_identify_columns,
+    'convert_csv_to_js': _bench_convert_csv_to_js,
+    'create_timeline_chart': _bench_create_timeline_chart,
+}
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _stage_worker(stage, csv_path, work_dir, queue):
+    try:
+        run = STAGE_SETUP[stage](csv_path, work_dir)
+        started = time.perf_counter()
+        output_bytes = run()
+        queue.put({'wall_seconds': round(time.perf_counter() - started, 4),
+                   'peak_rss_mb': _peak_rss_mb(), 'output_bytes': output_bytes})
+    except Exception as e:
+        queue.put({'error': f"{type(e).__name__}: {e}"})
+
+
+def measure_stage(stage, csv_path, work_dir, timeout=DEFAULT_STAGE_TIMEOUT):
+    """Run a stage in a fresh process so its peak RSS is not polluted by earlier stages.
+
+    A worker that dies without reporting (segfault, OOM kill) or runs past
+    ``timeout`` seconds gives {'error': ...} instead of blocking the run.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    results = ctx.Queue()
+    proc = ctx.Process(target=_stage_worker, args=(stage, csv_path, work_dir, results))
+    proc.start()
+    deadline = time.monotonic() + timeout
+    result = None
+    while result is None:
+        try:
+            result = results.get(timeout=1.0)
+        except queue.Empty:
+            if proc.exitcode is not None:
+                # Exited without a result; drain once in case it raced the poll
+                try:
+                    result = results.get(timeout=1.0)
+                except queue.Empty:
+                    result = {'error': f"worker exited with code {proc.exitcode} without a result"}
+            elif time.monotonic() > deadline:
+                proc.terminate()
+                result = {'error': f"timed out after {timeout}s"}
+    proc.join()
+    return result
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, stages=tuple(STAGE_SETUP), seed=0, stage_timeout=DEFAULT_STAGE_TIMEOUT):
+    """Results as {stage: {str(size): metrics}}; failed stages have {'error': ...} metrics"""
+    results = {stage: {} for stage in stages}
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            csv_path = generate_roadmap_csv(os.path.join(work_dir, f'roadmap_{size}.csv'), size, seed=seed)
+            for stage in stages:
+                metrics = measure_stage(stage, csv_path, work_dir, timeout=stage_timeout)
+                results[stage][str(size)] = metrics
+                shown = metrics.get('error') or (f"{metrics['wall_seconds']:.3f}s, "
+                                                 f"{metrics['peak_rss_mb']} MB peak, {metrics['output_bytes']} bytes")
+                print(f"  {stage:<24} n={size:<8} {shown}")
+    return results
+
+
+# Modules on the pure-CSV paths, and the libraries they must not import at load time
+LIGHT_MODULES = ('roadmap_cli', 'convert_csv', 'data_converter')
+HEAVY_MODULES = ('pandas', 'numpy', 'matplotlib', 'pyarrow', 'seaborn')
+
+# Prints its metrics, then fails (exit 1) when a heavy library ended up in sys.modules
+_IMPORT_PROBE = '''
+import json, sys, time
+started = time.perf_counter()
+import {module}
+heavy = sorted(m for m in {heavy!r} if m in sys.modules)
+print(json.dumps({{'wall_seconds': round(time.perf_counter() - started, 4), 'heavy_imports': heavy}}), flush=True)
+assert not heavy, "import {module} loads " + ", ".join(heavy)
+'''
+
+
+def _importtime_ms(stderr, names):
+    """Cumulative import time in ms of each of ``names`` from `python -X importtime` output"""
+    found = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|', 2)
+        name = name.strip()
+        if name in names and cumulative.strip().isdigit():
+            found[name] = round(int(cumulative) / 1000, 1)
+    return found
+
+
+def measure_startup(modules=LIGHT_MODULES):
+    """Import time of each module in a fresh interpreter, as {'import <module>': {'startup': metrics}}"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    results = {}
+    for module in modules:
+        probe = _IMPORT_PROBE.format(module=module, heavy=HEAVY_MODULES)
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', probe],
+                              cwd=script_dir, capture_output=True, text=True)
+        if not proc.stdout.strip():
+            # Crashed before the probe could report (e.g. the module raised on import)
+            errors = [line for line in proc.stderr.splitlines() if not line.startswith('import time:')]
+            metrics = {'error': errors[-1] if errors else f"exit code {proc.returncode}"}
+        else:
+            metrics = json.loads(proc.stdout)
+            if metrics['heavy_imports']:
+                metrics['heavy_import_ms'] = _importtime_ms(proc.stderr, metrics['heavy_imports'])
+        results[f"import {module}"] = {'startup': metrics}
+        shown = metrics.get('error') or (f"{metrics['wall_seconds']:.3f}s"
+                                         + (f", pulls in {', '.join(metrics['heavy_imports'])}"
+                                            if metrics['heavy_imports'] else ""))
+        print(f"  {'import ' + module:<24} {'':<10} {shown}")
+    return results
+
+
+def startup_regressions(results):
+    """Light modules that now import pandas/NumPy/matplotlib at load time (no baseline needed)"""
+    return [f"{stage}: imports {', '.join(f'{m} ({ms} ms)' for m, ms in metrics['heavy_import_ms'].items())} "
+            f"at load time" if metrics.get('heavy_import_ms') else
+            f"{stage}: imports {', '.join(metrics['heavy_imports'])} at load time"
+            for stage, by_size in results.items() for metrics in by_size.values()
+            if metrics.get('heavy_imports')]
+
+
+def stage_failures(results):
+    """Stages that crashed, raised or timed out (no baseline needed)"""
+    return [f"{stage} n={size}: failed ({metrics['error']})"
+            for stage, by_size in results.items() for size, metrics in by_size.items()
+            if 'error' in metrics]
+
+
+# Ignore timing jitter on stages that only take a few milliseconds
+MIN_WALL_DELTA = 0.05
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25):
+    """List of human-readable regressions: slower or bigger than baseline by more than `tolerance`"""
+    regressions = []
+    for stage, by_size in results.items():
+        for size, metrics in by_size.items():
+            base = baseline.get(stage, {}).get(size)
+            if not base or 'error' in base or 'error' in metrics:
+                continue  # failures are reported by stage_failures
+            for key in ('wall_seconds', 'peak_rss_mb', 'output_bytes'):
+                old, new = base.get(key), metrics.get(key)
+                if key == 'wall_seconds' and new is not None and old and new - old < MIN_WALL_DELTA:
+                    continue
+                if old and new is not None and new > old * (1 + tolerance):
+                    regressions.append(f"{stage} n={size}: {key} {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the roadmap ingestion and rendering pipeline")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="comma-separated row counts, e.g. 100,1000,10000,100000,1000000")
+    parser.add_argument('--stages', default=','.join(STAGE_SETUP))
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--stage-timeout', type=float, default=DEFAULT_STAGE_TIMEOUT,
+                        help="seconds before a stage is killed and recorded as failed")
+    parser.add_argument('--output', help="also write the results as JSON to this file")
+    parser.add_argument('--skip-startup', action='store_true', help="do not measure module import times")
+    parser.add_argument('--check-imports', action='store_true',
+                        help="only check that the light modules import without pandas/NumPy/matplotlib/pyarrow; "
+                             "exits 1 if any does")
+    args = parser.parse_args(argv)
+
+    if args.check_imports:
+        print(f"Checking load-time imports of {', '.join(LIGHT_MODULES)}")
+        results = measure_startup()
+        failures = stage_failures(results) + startup_regressions(results)
+        for line in failures:
+            print(f"  ✗ {line}")
+        return 1 if failures else 0
+
+    sizes = [int(float(s)) for s in args.sizes.split(',')]
+    print(f"Benchmarking {args.stages} at sizes {sizes}")
+    results = run_benchmarks(sizes, args.stages.split(','), stage_timeout=args.stage_timeout)
+    if not args.skip_startup:
+        results.update(measure_startup())
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+    regressions = stage_failures(results) + startup_regressions(results)
+    if not os.path.exists(args.baseline) and not regressions:
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            regressions += compare_to_baseline(results, json.load(f), args.tolerance)
+    if regressions:
+        print("\nRegressions against baseline:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+
+CACHE_DIR = '.roadmap_cache'
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+
+def _file_signature(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """On-disk cache of pipeline stage outputs keyed by input content hash and settings.
+
+    Each stage (Excel->CSV, CSV->JS, chart rendering) computes a key from the
+    content of its input files plus any settings that affect the output. When
+    the key is already cached the stage restores its outputs (or finds them
+    already in place) and skips the work. Output blobs are evicted least
+    recently used first once the cache grows past ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes=MAX_CACHE_BYTES, enabled=True):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = enabled and not os.environ.get('ROADMAP_NO_CACHE')
+        self.index_file = os.path.join(cache_dir, 'index.json')
+        self.blob_dir = os.path.join(cache_dir, 'blobs')
+        self._index = None
+
+    # ---- index persistence -------------------------------------------------
+    def _load(self):
+        if self._index is None:
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+            self._index.setdefault('hashes', {})
+            self._index.setdefault('entries', {})
+        return self._index
+
+    def _save(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = self.index_file + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp, self.index_file)
+
+    # ---- hashing -----------------------------------------------------------
+    def file_hash(self, path):
+        """Content hash of a file, memoized by (size, mtime) so unchanged files are not re-read"""
+        hashes = self._load()['hashes']
+        path_key = os.path.abspath(path)
+        signature = _file_signature(path)
+        known = hashes.get(path_key)
+        if known and known['sig'] == signature:
+            return known['sha256']
+        digest = _sha256_file(path)
+        hashes[path_key] = {'sig': signature, 'sha256': digest}
+        return digest
+
+    def key(self, stage, inputs=(), settings=None):
+        """Cache key for a stage from its input files' content and its settings"""
+        payload = {
+            'stage': stage,
+            'inputs': [self.file_hash(p) for p in inputs],
+            'settings': settings or {},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    # ---- lookup / store ----------------------------------------------------
+    def restore(self, key, outputs):
+        """Return the cached entry's metadata if every output can be served from cache, else None"""
+        if not self.enabled:
+            return None
+        entry = self._load()['entries'].get(key)
+        if entry is None or len(entry['outputs']) != len(outputs):
+            return None
+        blobs = [os.path.join(self.blob_dir, digest) for digest in entry['outputs']]
+        if not all(os.path.exists(b) for b in blobs):
+            return None
+
+        for path, digest, blob in zip(outputs, entry['outputs'], blobs):
+            if os.path.exists(path) and self.file_hash(path) == digest:
+                continue
+            tmp = path + '.tmp'
+            shutil.copyfile(blob, tmp)
+            os.replace(tmp, path)
+        entry['used'] = time.time()
+        self._save()
+        return entry.get('meta', {})
+
+    def store(self, key, outputs, meta=None):
+        """Record a stage's freshly written outputs under ``key``"""
+        if not self.enabled:
+            return
+        os.makedirs(self.blob_dir, exist_ok=True)
+        digests = []
+        for path in outputs:
+            digest = self.file_hash(path)
+            blob = os.path.join(self.blob_dir, digest)
+            if not os.path.exists(blob):
+                shutil.copyfile(path, blob + '.tmp')
+                os.replace(blob + '.tmp', blob)
+            digests.append(digest)
+        self._load()['entries'][key] = {'outputs': digests, 'meta': meta or {}, 'used': time.time()}
+        self._evict()
+        self._save()
+
+    def _evict(self):
+        entries = self._index['entries']
+        sizes = {}
+        for name in os.listdir(self.blob_dir):
+            sizes[name] = os.path.getsize(os.path.join(self.blob_dir, name))
+        total = sum(sizes.values())
+        for key in sorted(entries, key=lambda k: entries[k]['used']):
+            if total <= self.max_bytes:
+                break
+            dropped = entries.pop(key)
+            still_used = {d for e in entries.values() for d in e['outputs']}
+            for digest in dropped['outputs']:
+                if digest not in still_used and digest in sizes:
+                    os.remove(os.path.join(self.blob_dir, digest))
+                    total -= sizes.pop(digest)
+        # Forget hashes of files that no longer exist
+        hashes = self._index['hashes']
+        for path in [p for p in hashes if not os.path.exists(p)]:
+            del hashes[path]
+
+    def clear(self):
+        """Drop every cached entry and blob"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self._index = None
@@ -1,52 +1,151 @@
+import argparse
 import csv
 import json
+from collections import namedtuple
+from build_cache import BuildCache
+from pipeline_metrics import stage
+import quarter_parser
+from quarter_parser import parse_quarter
 
-def convert_csv_to_js():
-    roadmap_data = []
-    
-    with open('FY26_27 Me@Sams_timeline dashboard.csv', 'r', encoding='utf-8') as file:
+CSV_FILE = 'FY26_27 Me@Sams_timeline dashboard.csv'
+JS_FILE = 'roadmap_data.js'
+
+# Output field -> CSV header in the timeline export
+COLUMN_MAPPING = {
+    'title': 'Product Item Name',
+    'quarter': 'Proposed Roadmap (Launch) FY QTR',
+    'category': 'Product Group',
+    'status': 'Product Development Life Cycle Stage',
+    'priority': 'PPD Priority',
+    'product': 'Product',
+    'itemType': 'Item Type',
+    'productManager': 'Product Manager',
+    'productLeader': 'Product Leader '
+}
+
+ConversionResult = namedtuple('ConversionResult', ['count', 'quarters'])
+
+# Fields covered by roadmap_signature, in order
+SIGNATURE_FIELDS = ('title', 'quarter', 'category', 'status', 'priority')
+
+def iter_roadmap_items(csv_file=CSV_FILE):
+    """Lazily yield cleaned roadmap items from the timeline CSV export"""
+    with open(csv_file, 'r', encoding='utf-8-sig', newline='') as file:
         reader = csv.DictReader(file)
-        
+
         for row in reader:
             # Clean and map the data
-            item = {
-                'title': row['Product Item Name'].strip(),
-                'quarter': row['Proposed Roadmap (Launch) FY QTR'].strip(),
-                'category': row['Product Group'].strip(),
-                'status': row['Product Development Life Cycle Stage'].strip(),
-                'priority': row['PPD Priority'].strip(),
-                'product': row['Product'].strip(),
-                'itemType': row['Item Type'].strip(),
-                'productManager': row['Product Manager'].strip(),
-                'productLeader': row['Product Leader '].strip()
-            }
-            
+            item = {field: row[column].strip() for field, column in COLUMN_MAPPING.items()}
+
             # Only include items with valid quarter data
             if item['quarter'] and item['quarter'] != '':
-                roadmap_data.append(item)
-    
-    # Generate JavaScript array
-    js_data = "let roadmapData = " + json.dumps(roadmap_data, indent=4) + ";"
-    
-    with open('roadmap_data.js', 'w', encoding='utf-8') as outfile:
-        outfile.write(js_data)
-    
-    print(f"Converted {len(roadmap_data)} items from CSV to JavaScript")
-    return roadmap_data
+                # Normalize FY spellings to the dashboard's 'FY2026 Q1' form
+                span = parse_quarter(item['quarter'])
+                if span:
+                    item['quarter'] = span.label
+                yield item
 
-if __name__ == "__main__":
-    data = convert_csv_to_js()
-    print(f"Created roadmap_data.js with {len(data)} items")
-    
-    # Show quarter breakdown
+def write_roadmap_js(items, outfile, compact=False):
+    """Stream items into a `let roadmapData = [...]` file, one array element at a time.
+
+    Returns a ConversionResult with the item count and per-quarter counts,
+    computed in the same pass so memory stays flat regardless of input size.
+    """
     quarters = {}
-    for item in data:
-        quarter = item['quarter']
-        if quarter in quarters:
-            quarters[quarter] += 1
+    count = 0
+
+    outfile.write("let roadmapData = [")
+    for item in items:
+        if compact:
+            element = json.dumps(item, separators=(',', ':'))
+            outfile.write(element if count == 0 else "," + element)
         else:
-            quarters[quarter] = 1
-    
+            # Matches json.dumps(roadmap_data, indent=4) element by element
+            element = json.dumps(item, indent=4).replace("\n", "\n    ")
+            outfile.write(("\n    " if count == 0 else ",\n    ") + element)
+        count += 1
+        quarters[item['quarter']] = quarters.get(item['quarter'], 0) + 1
+
+    if count and not compact:
+        outfile.write("\n")
+    outfile.write("];")
+    return ConversionResult(count, quarters)
+
+def convert_csv_to_js(csv_file=CSV_FILE, js_file=JS_FILE, compact=False, cache=None):
+    """Convert the timeline CSV export to roadmap_data.js without holding all rows in memory"""
+    if cache is None:
+        cache = BuildCache()
+    with stage('csv2js', cached=False) as timing:
+        key = cache.key('csv2js', inputs=[csv_file, __file__, quarter_parser.__file__],
+                        settings={'columns': COLUMN_MAPPING, 'compact': compact})
+        meta = cache.restore(key, [js_file])
+        if meta is not None:
+            timing.rows, timing.labels['cached'] = meta['count'], True
+            print(f"{js_file} is up to date ({meta['count']} items, cached)")
+            return ConversionResult(meta['count'], meta['quarters'])
+
+        with open(js_file, 'w', encoding='utf-8') as outfile:
+            result = write_roadmap_js(iter_roadmap_items(csv_file), outfile, compact=compact)
+        cache.store(key, [js_file], meta=result._asdict())
+        timing.rows = result.count
+
+    print(f"Converted {result.count} items from CSV to JavaScript")
+    return result
+
+def roadmap_signature(items):
+    """FNV-1a hash over the dashboard fields of every item, in order.
+
+    Matches roadmapSignature() in the dashboard (which hashes UTF-16 code
+    units), so generated index/layout files can be checked against the page's
+    own roadmapData before their positions are trusted.
+    """
+    h = 0x811c9dc5
+    for item in items:
+        text = '\x1f'.join(str(item.get(field) or '') for field in SIGNATURE_FIELDS) + '\x1e'
+        for unit in memoryview(text.encode('utf-16-le')).cast('H'):
+            h = ((h ^ unit) * 0x01000193) & 0xffffffff
+    return f"{h:08x}"
+
+def quarter_sort_key(entry):
+    """Sort (quarter, count) pairs chronologically, unparseable quarters last"""
+    span = parse_quarter(entry[0])
+    return (span is None, span.ordinal if span else 0, entry[0])
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert the roadmap CSV export to roadmap_data.js")
+    parser.add_argument('csv_file', nargs='?', default=CSV_FILE)
+    parser.add_argument('-o', '--output', default=JS_FILE)
+    parser.add_argument('--compact', action='store_true', help="write minified JSON instead of indented")
+    parser.add_argument('--no-cache', action='store_true', help="always regenerate, ignoring the build cache")
+    parser.add_argument('--updates', metavar='DIR', help="also publish an incremental changeset for the dashboard into DIR")
+    parser.add_argument('--history', metavar='FILE', help="also record this build as today's snapshot in FILE (roadmap_history)")
+    args = parser.parse_args(argv)
+
+    result = convert_csv_to_js(args.csv_file, args.output, compact=args.compact,
+                               cache=BuildCache(enabled=not args.no_cache))
+    print(f"Created {args.output} with {result.count} items")
+
+    if args.updates:
+        from roadmap_delta import publish_updates
+        entry = publish_updates(iter_roadmap_items(args.csv_file), args.updates)
+        if entry is None:
+            print(f"No roadmap changes since the last build in {args.updates}")
+        else:
+            print(f"Published roadmap v{entry['to']} to {args.updates}: "
+                  f"{entry['added']} added, {entry['changed']} changed, {entry['removed']} removed")
+
+    if args.history:
+        from roadmap_history import RoadmapHistory
+        added = RoadmapHistory(args.history).append(iter_roadmap_items(args.csv_file))
+        if added is None:
+            print(f"No roadmap changes since the latest snapshot in {args.history}")
+        else:
+            print(f"Recorded roadmap snapshot in {args.history} ({added} new item versions)")
+
+    # Show quarter breakdown
     print("\nQuarter breakdown:")
-    for quarter, count in sorted(quarters.items()):
-        print(f"  {quarter}: {count} items")
\ No newline at end of file
+    for quarter, count in sorted(result.quarters.items(), key=quarter_sort_key):
+        print(f"  {quarter}: {count} items")
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,29 @@
-import pandas as pd
 import os
+import csv
 import json
+import glob
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
+from build_cache import BuildCache
+from pipeline_metrics import stage
+from schema_inference import ROLE_LABELS, SCHEMA_CACHE_FILE, infer_schema
 
-def convert_excel_to_csv():
-    """Convert the Excel roadmap file to CSV for easier processing"""
+def convert_excel_to_csv(cache=None, table_format=None):
+    """Convert the Excel roadmap file to CSV for easier processing
+    
+    With table_format='arrow' or 'parquet' the normalized, typed roadmap table
+    is also written (roadmap_data.arrow / roadmap_data.parquet) for fast
+    downstream loading.
+    """
     
     excel_file = "FY26_27 Me@Sams Roadmap data file.xlsx"
+    csv_filename = "roadmap_data.csv"
+    outputs = [csv_filename]
+    if table_format:
+        table_filename = f"roadmap_data.{table_format}"
+        outputs.append(table_filename)
     
     if not os.path.exists(excel_file):
         print(f"❌ Excel file '{excel_file}' not found in current directory")
@@ -15,11 +33,20 @@ def convert_excel_to_csv():
                 print(f"  - {file}")
         return False
     
+    if cache is None:
+        cache = BuildCache()
+    cache_key = cache.key('excel2csv', inputs=[excel_file, __file__], settings={'table_format': table_format})
+    if cache.restore(cache_key, outputs) is not None:
+        print(f"♻️  {csv_filename} is up to date with {excel_file} (cached)")
+        return True
+    
     try:
         print(f"📖 Reading Excel file: {excel_file}")
+        import pandas as pd
         
         # Try to read all sheets
-        excel_file_obj = pd.ExcelFile(excel_file)
+        with stage('excel.open'):
+            excel_file_obj = pd.ExcelFile(excel_file)
         sheet_names = excel_file_obj.sheet_names
         
         print(f"📄 Found {len(sheet_names)} sheet(s): {', '.join(sheet_names)}")
@@ -35,7 +62,9 @@ def convert_excel_to_csv():
             roadmap_sheet = sheet_names[0]  # Use first sheet as fallback
         
         print(f"📊 Using sheet: '{roadmap_sheet}'")
-        df = pd.read_excel(excel_file, sheet_name=roadmap_sheet)
+        with stage('excel.parse', sheet=roadmap_sheet) as timing:
+            df = excel_file_obj.parse(roadmap_sheet)
+            timing.rows = len(df)
         
         print(f"✅ Successfully loaded {len(df)} rows and {len(df.columns)} columns")
         print("\n📋 Column names found:")
@@ -43,17 +72,25 @@ def convert_excel_to_csv():
             print(f"  {i}. {col}")
         
         # Save as CSV
-        csv_filename = "roadmap_data.csv"
-        df.to_csv(csv_filename, index=False)
+        with stage('excel.write_csv', rows=len(df)):
+            df.to_csv(csv_filename, index=False)
         print(f"\n💾 Saved as CSV: {csv_filename}")
         
+        if table_format:
+            from roadmap_table import normalize_roadmap, write_roadmap_table
+            with stage('excel.write_table', rows=len(df), format=table_format):
+                write_roadmap_table(normalize_roadmap(df), table_filename)
+            print(f"💾 Saved typed roadmap table: {table_filename}")
+        cache.store(cache_key, outputs)
+        
         # Show sample data
         print("\n👀 Sample data (first 3 rows):")
         print(df.head(3).to_string())
         
         # Try to identify key columns
         print("\n🔍 Analysis of columns:")
-        identify_columns(df)
+        with stage('identify_columns', rows=len(df)):
+            identify_columns(df)
         
         return True
         
@@ -61,56 +98,133 @@ def convert_excel_to_csv():
         print(f"❌ Error reading Excel file: {str(e)}")
         return False
 
-def identify_columns(df):
-    """Analyze columns to identify roadmap elements"""
+def find_workbooks(source):
+    """Expand a directory, glob pattern or single path into a sorted list of workbook files"""
+    if os.path.isdir(source):
+        pattern_paths = glob.glob(os.path.join(source, '*.xlsx')) + glob.glob(os.path.join(source, '*.xls'))
+    else:
+        pattern_paths = glob.glob(source)
+    # Skip Office lock files left behind by open workbooks
+    return sorted(p for p in pattern_paths if not os.path.basename(p).startswith('~$'))
+
+def _ingest_workbook(path):
+    """Worker task: parse every roadmap sheet of one workbook through a single ExcelFile handle.
+    
+    A workbook that cannot be read (corrupt zip, not an Excel file, malformed
+    sheet) yields no frames and an 'error' message instead of failing the batch.
+    """
+    import pandas as pd
+    from roadmap_table import is_roadmap_export, normalize_roadmap
     
-    suggestions = {
-        'title_columns': [],
-        'date_columns': [],
-        'category_columns': [],
-        'status_columns': []
+    started = time.perf_counter()
+    frames = []
+    skipped = []
+    error = None
+    try:
+        with pd.ExcelFile(path) as workbook:
+            for sheet in workbook.sheet_names:
+                raw = workbook.parse(sheet)
+                if not is_roadmap_export(raw):
+                    skipped.append(sheet)
+                    continue
+                table = normalize_roadmap(raw)
+                table['source_file'] = os.path.basename(path)
+                table['source_sheet'] = sheet
+                frames.append(table)
+    except Exception as e:  # BadZipFile, openpyxl's InvalidFileException, KeyError from a broken sheet, ...
+        frames, error = [], f"{type(e).__name__}: {e}"
+    return {
+        'file': path,
+        'frames': frames,
+        'skipped': skipped,
+        'error': error,
+        'rows': sum(len(f) for f in frames),
+        'seconds': time.perf_counter() - started,
     }
+
+def ingest_workbooks(source, max_workers=None):
+    """Parse every roadmap sheet of every workbook under ``source`` in a process pool.
     
-    for col in df.columns:
-        col_lower = col.lower()
-        sample_values = df[col].dropna().head().astype(str).str.lower()
-        
-        # Check for title/name columns
-        if any(keyword in col_lower for keyword in ['title', 'name', 'initiative', 'project', 'feature', 'item']):
-            suggestions['title_columns'].append(col)
-        
-        # Check for date/quarter columns
-        elif any(keyword in col_lower for keyword in ['date', 'quarter', 'q1', 'q2', 'q3', 'q4', 'launch', 'release', 'timeline', 'when']):
-            suggestions['date_columns'].append(col)
-        
-        # Check for category columns
-        elif any(keyword in col_lower for keyword in ['category', 'team', 'area', 'domain', 'type', 'group']):
-            suggestions['category_columns'].append(col)
-        
-        # Check for status columns
-        elif any(keyword in col_lower for keyword in ['status', 'state', 'progress', 'phase']):
-            suggestions['status_columns'].append(col)
-        
-        # Check sample values for quarter patterns
-        elif any('fy' in val and 'q' in val for val in sample_values):
-            suggestions['date_columns'].append(col)
+    Returns (table, report): one normalized roadmap table tagged with
+    source_file/source_sheet, and per-file timing/row counts. Workbooks that
+    fail to parse are left out of the table and carry their 'error' in the report.
+    """
+    import pandas as pd
+    from roadmap_table import CATEGORICAL_COLUMNS
+    
+    paths = find_workbooks(source)
+    if not paths:
+        raise FileNotFoundError(f"No workbooks found for '{source}'")
+    
+    report = []
+    frames = []
+    with stage('batch.ingest', files=len(paths)) as timing, ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for result in pool.map(_ingest_workbook, paths):
+            frames.extend(result.pop('frames'))
+            report.append(result)
+        timing.rows = sum(entry['rows'] for entry in report)
+    
+    if not frames:
+        failed = [f"{os.path.basename(entry['file'])} ({entry['error']})" for entry in report if entry['error']]
+        detail = f"; unreadable: {', '.join(failed)}" if failed else ""
+        raise ValueError(f"None of the workbooks contain a roadmap sheet{detail}")
+    table = pd.concat(frames, ignore_index=True)
+    # Categories differ per sheet, so concat falls back to object; re-encode once
+    for column in CATEGORICAL_COLUMNS + ['source_file', 'source_sheet']:
+        table[column] = table[column].astype('category')
+    return table, report
+
+def convert_workbooks(source, csv_filename="roadmap_data.csv", table_format=None, max_workers=None):
+    """Batch mode: merge all business-unit workbooks into one roadmap CSV (and optional typed table)"""
+    print(f"📚 Batch ingesting workbooks from: {source}")
+    started = time.perf_counter()
+    try:
+        table, report = ingest_workbooks(source, max_workers=max_workers)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return False
+    
+    print("\n⏱️  Per-file timing:")
+    for entry in report:
+        if entry['error']:
+            print(f"  ❌ {os.path.basename(entry['file'])}: could not be read ({entry['error']}), skipped")
+            continue
+        skipped = f", skipped sheets: {', '.join(entry['skipped'])}" if entry['skipped'] else ""
+        print(f"  {os.path.basename(entry['file'])}: {entry['rows']} rows in {entry['seconds']:.2f}s{skipped}")
+    failed = sum(1 for entry in report if entry['error'])
+    
+    # Keep the export's headers in the CSV so convert_csv.py reads it unchanged
+    from convert_csv import COLUMN_MAPPING
+    export = table.drop(columns=['quarter_ordinal']).rename(columns=COLUMN_MAPPING)
+    with stage('batch.write_csv', rows=len(table)):
+        export.to_csv(csv_filename, index=False)
+    print(f"\n💾 Saved merged CSV: {csv_filename} ({len(table)} rows from {len(report) - failed} workbook(s))")
+    if failed:
+        print(f"⚠️  {failed} workbook(s) could not be read and were left out")
+    if table_format:
+        from roadmap_table import write_roadmap_table
+        table_filename = f"{os.path.splitext(csv_filename)[0]}.{table_format}"
+        write_roadmap_table(table, table_filename)
+        print(f"💾 Saved typed roadmap table: {table_filename}")
+    print(f"✅ Batch ingestion finished in {time.perf_counter() - started:.2f}s")
+    return True
+
+def identify_columns(df, pinned=None, cache_file=SCHEMA_CACHE_FILE):
+    """Analyze columns to identify roadmap elements"""
+    
+    schema = infer_schema(df, pinned=pinned, cache_file=cache_file)
     
     # Print suggestions
-    for key, columns in suggestions.items():
-        if columns:
-            category_name = key.replace('_', ' ').title()
-            print(f"  {category_name}: {', '.join(columns)}")
+    for role, column in schema.items():
+        if column is not None:
+            print(f"  {ROLE_LABELS.get(role, role)}: {column}")
     
     # Generate mapping suggestions
     print("\n💡 Suggested column mapping for visualization:")
-    if suggestions['title_columns']:
-        print(f"  Title/Name: {suggestions['title_columns'][0]}")
-    if suggestions['date_columns']:
-        print(f"  Launch Quarter: {suggestions['date_columns'][0]}")
-    if suggestions['category_columns']:
-        print(f"  Category: {suggestions['category_columns'][0]}")
-    if suggestions['status_columns']:
-        print(f"  Status: {suggestions['status_columns'][0]}")
+    for role in ('title', 'quarter', 'category', 'status'):
+        if schema[role] is not None:
+            print(f"  {ROLE_LABELS[role]}: {schema[role]}")
+    return schema
 
 def create_sample_csv():
     """Create a sample CSV file with the expected format"""
@@ -166,17 +280,30 @@ def create_sample_csv():
         }
     ]
     
-    df = pd.DataFrame(sample_data)
-    df.to_csv('sample_roadmap_data.csv', index=False)
+    with open('sample_roadmap_data.csv', 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(sample_data[0]))
+        writer.writeheader()
+        writer.writerows(sample_data)
     print("📝 Created sample CSV file: sample_roadmap_data.csv")
     print("   Use this as a template for your data structure")
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert roadmap workbooks to CSV")
+    parser.add_argument('--batch', metavar='DIR_OR_GLOB',
+                        help="merge every roadmap sheet of every workbook in a directory or glob")
+    parser.add_argument('--workers', type=int, default=None, help="process pool size for --batch")
+    args = parser.parse_args(argv)
+    
     print("🚀 Me@Sams Roadmap Data Converter")
     print("=" * 50)
     
-    # Try to convert existing Excel file
-    success = convert_excel_to_csv()
+    # Write the Arrow table alongside the CSV when pyarrow is available
+    table_format = 'arrow' if find_spec('pyarrow') else None
+    if args.batch:
+        success = convert_workbooks(args.batch, table_format=table_format, max_workers=args.workers)
+    else:
+        # Try to convert existing Excel file
+        success = convert_excel_to_csv(table_format=table_format)
     
     if not success:
         print("\n📝 Creating sample template instead...")
@@ -0,0 +1,143 @@
+import json
+import os
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows: peak RSS is not reported
+    resource = None
+
+# Off by default; operators turn it on through the environment, without editing any script:
+#   ROADMAP_METRICS=metrics.jsonl        append one JSON line per stage ('-' for stderr)
+#   ROADMAP_METRICS_FORMAT=openmetrics   write OpenMetrics text instead (rewritten after each stage)
+#   ROADMAP_PROFILE=profiles/            also dump cProfile stats (.prof) and the top tracemalloc
+#                                        allocations of each top-level stage into this directory
+METRICS_ENV = 'ROADMAP_METRICS'
+FORMAT_ENV = 'ROADMAP_METRICS_FORMAT'
+PROFILE_ENV = 'ROADMAP_PROFILE'
+
+RUN_ID = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+_records = []
+_depth = 0
+
+
+class StageRecord:
+    """Mutable result of one stage; set ``rows`` inside the ``with`` block"""
+
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+        self.rows = None
+        self.measured = {}
+
+    def as_dict(self):
+        return {'run': RUN_ID, 'stage': self.name, 'script': os.path.basename(sys.argv[0] or 'python'),
+                **self.measured, 'rows': self.rows, **self.labels}
+
+
+def enabled():
+    return bool(os.environ.get(METRICS_ENV) or os.environ.get(PROFILE_ENV))
+
+
+def _process_peak_rss_mb():
+    """High-water mark of the whole process so far, not of any one stage (ru_maxrss never goes down)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _openmetrics(records):
+    metrics = [
+        ('roadmap_stage_wall_seconds', 'gauge', 'Wall-clock time of a pipeline stage', 'wall_seconds'),
+        ('roadmap_stage_cpu_seconds', 'gauge', 'CPU time of a pipeline stage', 'cpu_seconds'),
+        ('roadmap_stage_rows', 'gauge', 'Rows processed by a pipeline stage', 'rows'),
+        ('roadmap_process_peak_rss_megabytes', 'gauge',
+         'Peak RSS of the whole process so far, sampled when a pipeline stage ends', 'process_peak_rss_mb'),
+        ('roadmap_stage_python_peak_megabytes', 'gauge',
+         'Peak traced Python allocations during a profiled top-level stage', 'py_peak_mb'),
+    ]
+    lines = []
+    for name, kind, help_text, field in metrics:
+        lines += [f"# TYPE {name} {kind}", f"# HELP {name} {help_text}"]
+        for record in records:
+            if record.get(field) is not None:
+                labels = ','.join(f'{k}="{_escape(record[k])}"' for k in ('run', 'script', 'stage'))
+                lines.append(f"{name}{{{labels}}} {record[field]}")
+    lines.append("# EOF")
+    return '\n'.join(lines) + '\n'
+
+
+def _emit(record):
+    target = os.environ.get(METRICS_ENV)
+    if not target:
+        return
+    if target == '-':
+        print(json.dumps(record), file=sys.stderr)
+    elif os.environ.get(FORMAT_ENV, '').lower() == 'openmetrics':
+        _records.append(record)
+        with open(target + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(_openmetrics(_records))
+        os.replace(target + '.tmp', target)
+    else:
+        with open(target, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+def _dump_profile(name, profiler, snapshot):
+    out_dir = os.environ[PROFILE_ENV]
+    os.makedirs(out_dir, exist_ok=True)
+    base = os.path.join(out_dir, f"{RUN_ID}-{name}")
+    profiler.dump_stats(base + '.prof')
+    with open(base + '.tracemalloc.txt', 'w', encoding='utf-8') as f:
+        for stat in snapshot.statistics('lineno')[:25]:
+            f.write(f"{stat}\n")
+
+
+@contextmanager
+def stage(name, rows=None, **labels):
+    """Measure a pipeline stage: ``with stage('csv2js') as s: ...; s.rows = n``"""
+    global _depth
+    record = StageRecord(name, labels)
+    record.rows = rows
+    if not enabled():
+        yield record
+        return
+
+    profiler = None
+    if os.environ.get(PROFILE_ENV) and _depth == 0:
+        # cProfile cannot nest, so only top-level stages are profiled
+        import cProfile
+        import tracemalloc
+        tracemalloc.start()
+        profiler = cProfile.Profile()
+        profiler.enable()
+    _depth += 1
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield record
+    finally:
+        measured = {
+            'wall_seconds': round(time.perf_counter() - wall, 6),
+            'cpu_seconds': round(time.process_time() - cpu, 6),
+            'process_peak_rss_mb': _process_peak_rss_mb(),
+            'ts': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        }
+        _depth -= 1
+        if profiler is not None:
+            profiler.disable()
+            snapshot = tracemalloc.take_snapshot()
+            measured['py_peak_mb'] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+            tracemalloc.stop()
+            _dump_profile(name, profiler, snapshot)
+        record.measured = measured
+        _emit(record.as_dict())
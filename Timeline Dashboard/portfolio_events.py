@@ -0,0 +1,233 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+from datetime import date, datetime, timedelta
+from quarter_parser import parse_quarter
+
+PORTFOLIO_CSV = 'People Transformation Portfolio Overview.csv'
+EVENT_LOG = 'portfolio_events.jsonl'
+
+# Update column -> event kind
+UPDATE_COLUMNS = {
+    "What we've Done": 'done',
+    "What we're Doing": 'doing',
+    "Where we're Going": 'going',
+}
+
+RAG_STATUS = {
+    'green': 'green', 'g': 'green', 'on track': 'green', 'complete': 'green', 'completed': 'green',
+    'yellow': 'amber', 'amber': 'amber', 'y': 'amber', 'a': 'amber', 'at risk': 'amber',
+    'red': 'red', 'r': 'red', 'off track': 'red', 'blocked': 'red',
+}
+
+# "9.19: Held feedback session..." / "10/2 - ..." at the start of an update
+DATE_PREFIX = re.compile(r'^\s*(\d{1,2})[./](\d{1,2})(?:[./](\d{2,4}))?\s*[:\-]\s*')
+SEGMENT_SPLIT = re.compile(r'[;\n]+')
+OWNER_SPLIT = re.compile(r'\s*(?:;|,|/|&|\band\b)\s*')
+
+# Dated updates more than this far after the as-of date are taken to be from last year
+MAX_FUTURE_DAYS = 60
+
+
+def normalize_rag(value):
+    """Map free-text status to green / amber / red ('unknown' when unrecognized)"""
+    return RAG_STATUS.get(re.sub(r'\s+', ' ', str(value or '')).strip().lower(), 'unknown')
+
+
+def split_owners(value):
+    """'Ana Lasa ; Kristi Mai' -> ['Ana Lasa', 'Kristi Mai']"""
+    return [name for name in OWNER_SPLIT.split(str(value or '').strip()) if name]
+
+
+def resolve_update_date(month, day, year=None, as_of=None):
+    """Calendar date for a 'month.day' prefix, picking the year closest before ``as_of``"""
+    if year:
+        year = int(year)
+        return date(year + 2000 if year < 100 else year, month, day)
+    as_of = as_of or date.today()
+    resolved = date(as_of.year, month, day)
+    if resolved > as_of + timedelta(days=MAX_FUTURE_DAYS):
+        resolved = date(as_of.year - 1, month, day)
+    return resolved
+
+
+def split_updates(cell, as_of=None):
+    """Yield (date or None, text) per update in a cell.
+
+    Updates are separated by semicolons or line breaks; an undated update
+    belongs to the most recent dated one before it in the same cell.
+    """
+    current = None
+    for segment in SEGMENT_SPLIT.split(str(cell or '')):
+        segment = segment.strip()
+        if not segment:
+            continue
+        match = DATE_PREFIX.match(segment)
+        if match:
+            month, day, year = match.groups()
+            try:
+                current = resolve_update_date(int(month), int(day), year, as_of)
+                segment = segment[match.end():].strip()
+            except ValueError:
+                pass  # not a date after all (e.g. "13.5: ...")
+        if segment:
+            yield current, segment
+
+
+def _event_id(*parts):
+    return hashlib.sha1('\x1f'.join(str(p) for p in parts).encode('utf-8')).hexdigest()[:16]
+
+
+def iter_portfolio_events(csv_file=PORTFOLIO_CSV, as_of=None):
+    """Stream typed events from the portfolio overview CSV, one row at a time.
+
+    Per project a 'status' event (RAG status, owners, target quarter) and one
+    'update' event per dated update in the Done / Doing / Going columns.
+    Event IDs are content hashes, so re-ingesting an unchanged file yields
+    the same IDs and a changed status yields a new 'status' event.
+    """
+    if as_of is None:
+        as_of = datetime.fromtimestamp(os.path.getmtime(csv_file)).date()
+    with open(csv_file, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            row = {str(k).strip(): v for k, v in row.items() if k is not None}
+            project = (row.get('Project') or '').strip()
+            if not project:
+                continue
+            owners = split_owners(row.get('Project Manager'))
+            status = normalize_rag(row.get('Status'))
+            target = parse_quarter(row.get('Target Completion Date') or '')
+            yield {
+                'event_id': _event_id('status', project, status, owners, target and target.label),
+                'type': 'status',
+                'project': project,
+                'recorded': as_of.isoformat(),
+                'owners': owners,
+                'status': status,
+                'status_raw': (row.get('Status') or '').strip(),
+                'target_quarter': target.label if target else None,
+                'target_ordinal': target.ordinal if target else None,
+            }
+            for column, kind in UPDATE_COLUMNS.items():
+                for update_date, text in split_updates(row.get(column), as_of):
+                    day = update_date.isoformat() if update_date else None
+                    yield {
+                        'event_id': _event_id('update', project, kind, day, text),
+                        'type': 'update',
+                        'project': project,
+                        'recorded': as_of.isoformat(),
+                        'kind': kind,
+                        'date': day,
+                        'text': text,
+                        'owners': owners,
+                    }
+
+
+def read_events(log_file=EVENT_LOG, offset=0):
+    """(events, next_offset) appended to the log since byte ``offset``; pass next_offset back to read only new events"""
+    if not os.path.exists(log_file):
+        return [], 0
+    events = []
+    with open(log_file, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b'\n'):
+                break  # partially written last line; picked up on the next read
+            events.append(json.loads(line))
+            offset += len(line)
+    return events, offset
+
+
+# Sidecar ID index next to the log: a fixed-width header with the log offset it
+# covers, then one event ID per line, so appends never have to re-parse the log
+INDEX_SUFFIX = '.ids'
+_INDEX_HEADER = 'offset:{:020d}\n'
+
+
+def _load_seen(log_file):
+    """(event IDs in the log, sidecar lines to add) via the sidecar index, catching up on newer log lines"""
+    index_file = log_file + INDEX_SUFFIX
+    log_size = os.path.getsize(log_file) if os.path.exists(log_file) else 0
+    seen, offset = set(), 0
+    try:
+        with open(index_file, 'r', encoding='ascii') as f:
+            offset = int(f.readline().removeprefix('offset:'))
+            seen = {line.rstrip('\n') for line in f if line.endswith('\n')}
+    except (OSError, ValueError):
+        seen, offset = set(), 0
+    if offset > log_size:
+        # Log truncated or replaced since the index was written: rebuild from scratch
+        seen, offset = set(), 0
+        if os.path.exists(index_file):
+            os.remove(index_file)
+    # Lines appended after the index was last updated (other writers, or a crash in between)
+    missing = [event['event_id'] for event in read_events(log_file, offset)[0]]
+    return seen | set(missing), missing
+
+
+def _update_index(log_file, ids):
+    """Add ``ids`` to the sidecar index and mark it current with the log's size"""
+    index_file = log_file + INDEX_SUFFIX
+    if not os.path.exists(index_file):
+        with open(index_file, 'w', encoding='ascii', newline='\n') as f:
+            f.write(_INDEX_HEADER.format(0))
+    with open(index_file, 'r+', encoding='ascii', newline='\n') as f:
+        f.seek(0, os.SEEK_END)
+        f.writelines(f"{event_id}\n" for event_id in ids)
+        f.seek(0)
+        f.write(_INDEX_HEADER.format(os.path.getsize(log_file)))
+
+
+def append_events(events, log_file=EVENT_LOG):
+    """Append events whose IDs are not in the log yet; returns how many were written.
+
+    Known IDs come from the sidecar index (``<log>.ids``) rather than from
+    re-reading the whole log on every run.
+    """
+    seen, ids = _load_seen(log_file)
+    written = 0
+    with open(log_file, 'a', encoding='utf-8', newline='\n') as f:
+        for event in events:
+            if event['event_id'] in seen:
+                continue
+            seen.add(event['event_id'])
+            ids.append(event['event_id'])
+            f.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n')
+            written += 1
+        f.flush()
+        os.fsync(f.fileno())
+    # Log first: an index that lags behind the log is caught up on the next run
+    _update_index(log_file, ids)
+    return written
+
+
+def status_history(events):
+    """{project: [(recorded, status, target_quarter), ...]} from 'status' events, oldest first"""
+    history = {}
+    for event in events:
+        if event['type'] == 'status':
+            history.setdefault(event['project'], []).append(
+                (event['recorded'], event['status'], event['target_quarter']))
+    for entries in history.values():
+        entries.sort()
+    return history
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parse the portfolio overview CSV into an append-only event log")
+    parser.add_argument('csv_file', nargs='?', default=PORTFOLIO_CSV)
+    parser.add_argument('--log', default=EVENT_LOG)
+    parser.add_argument('--as-of', type=date.fromisoformat, default=None,
+                        help="date of this status report (YYYY-MM-DD); defaults to the file's modification date")
+    args = parser.parse_args()
+
+    written = append_events(iter_portfolio_events(args.csv_file, args.as_of), args.log)
+    print(f"✓ Appended {written} new events to {args.log}")
+
+    print("\n📊 Current status by project:")
+    for project, entries in sorted(status_history(read_events(args.log)[0]).items()):
+        recorded, status, target = entries[-1]
+        print(f"  {project}: {status} (target {target or 'n/a'}, as of {recorded})")
@@ -0,0 +1,158 @@
+import re
+from collections import namedtuple
+from datetime import datetime
+from functools import lru_cache
+
+# Fiscal calendar used across the roadmap tooling (and the dashboard's parseQuarter):
+# FY26 Q1 = Oct 2025, Q2 = Jan 2026, Q3 = Apr 2026, Q4 = Jul 2026
+QUARTER_START_MONTH = (0, 10, 1, 4, 7)
+QUARTER_YEAR_OFFSET = (0, -1, 0, 0, 0)
+
+_FY = r"FY\s*'?(\d{4}|\d{2})"
+_Q = r"Q([1-4])"
+_SEP = r"\s*[-_/]?\s*"
+_RANGE = r"\s*(?:-|–|—|to|through|thru)\s*"
+
+# Groups: 1 fy, 2 q, 3 end fy, 4 end q, 5 end q (same FY),
+#         6 q, 7 end q (same FY), 8 fy, 9 end q, 10 end fy
+QUARTER_PATTERN = (
+    r"^\s*(?:"
+    rf"{_FY}{_SEP}{_Q}(?:{_RANGE}(?:{_FY}{_SEP}{_Q}|{_Q}))?"
+    r"|"
+    rf"{_Q}(?:{_RANGE}{_Q})?{_SEP}{_FY}(?:{_RANGE}{_Q}{_SEP}{_FY})?"
+    r")\s*$"
+)
+QUARTER_REGEX = re.compile(QUARTER_PATTERN, re.IGNORECASE)
+
+QuarterSpan = namedtuple('QuarterSpan', ['fy', 'quarter', 'ordinal', 'end_ordinal', 'start_date', 'label'])
+
+
+def _full_year(fy):
+    fy = int(fy)
+    return fy + 2000 if fy < 100 else fy
+
+
+def quarter_ordinal(fy, quarter):
+    """Fiscal quarter ordinal: consecutive quarters differ by exactly 1"""
+    return fy * 4 + quarter - 1
+
+
+def ordinal_to_fy_quarter(ordinal):
+    """Inverse of quarter_ordinal -> (fiscal year, quarter number)"""
+    return ordinal // 4, ordinal % 4 + 1
+
+
+def ordinal_to_label(ordinal):
+    """Canonical dashboard label for an ordinal, e.g. 'FY2026 Q1'"""
+    fy, quarter = ordinal_to_fy_quarter(ordinal)
+    return f"FY{fy} Q{quarter}"
+
+
+def ordinal_to_start_date(ordinal):
+    """First calendar day of the fiscal quarter"""
+    fy, quarter = ordinal_to_fy_quarter(ordinal)
+    return datetime(fy + QUARTER_YEAR_OFFSET[quarter], QUARTER_START_MONTH[quarter], 1)
+
+
+def ordinal_start_dates(ordinals):
+    """Vectorized ordinal_to_start_date: float/int array (NaN = missing) -> datetime64[ns] array"""
+    import numpy as np
+
+    ordinals = np.asarray(ordinals, dtype='float64')
+    valid = ~np.isnan(ordinals)
+    safe = np.where(valid, ordinals, 0).astype(np.int64)
+    fy, q_index = safe // 4, safe % 4 + 1
+    # Lookup tables indexed by quarter number give the calendar start month
+    year = fy + np.asarray(QUARTER_YEAR_OFFSET)[q_index]
+    month = np.asarray(QUARTER_START_MONTH)[q_index]
+    start = ((year - 1970) * 12 + month - 1).astype('datetime64[M]').astype('datetime64[ns]')
+    start[~valid] = np.datetime64('NaT')
+    return start
+
+
+def _span_label(ordinal, end_ordinal):
+    if end_ordinal == ordinal:
+        return ordinal_to_label(ordinal)
+    return f"{ordinal_to_label(ordinal)} - {ordinal_to_label(end_ordinal)}"
+
+
+@lru_cache(maxsize=4096)
+def _parse_text(text):
+    match = QUARTER_REGEX.match(text)
+    if not match:
+        return None
+    g = match.groups()
+    fy = _full_year(g[0] or g[7])
+    quarter = int(g[1] or g[5])
+    end_fy = _full_year(g[2] or g[9] or fy)
+    end_quarter = int(g[3] or g[4] or g[6] or g[8] or quarter)
+    ordinal = quarter_ordinal(fy, quarter)
+    end_ordinal = max(ordinal, quarter_ordinal(end_fy, end_quarter))
+    return QuarterSpan(fy, quarter, ordinal, end_ordinal,
+                       ordinal_to_start_date(ordinal), _span_label(ordinal, end_ordinal))
+
+
+def parse_quarter(value):
+    """Parse a single quarter string ('FY26 Q1', 'Q1 FY2026', 'FY26 Q1-Q3', ...) to a QuarterSpan or None"""
+    if value is None:
+        return None
+    text = str(value).strip()
+    if not text or text.lower() == 'nan':
+        return None
+    return _parse_text(text)
+
+
+def parse_quarter_series(series):
+    """Vectorized quarter parsing for a whole pandas Series.
+
+    Distinct values are parsed once with a single regex extraction and mapped
+    back to rows by their factorized codes. Returns a DataFrame aligned with
+    ``series`` with columns fy, quarter, ordinal, end_ordinal (nullable Int64),
+    start_date (datetime64), label, and error (True where a non-blank value
+    could not be parsed).
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    uniques = pd.Series(uniques, dtype='object').astype('string')
+    parts = uniques.str.extract(QUARTER_PATTERN, flags=re.IGNORECASE)
+
+    def as_int(frame):
+        return pd.to_numeric(frame, errors='coerce').to_numpy(dtype='float64')
+
+    fy = as_int(parts[0].fillna(parts[7]))
+    fy = np.where(fy < 100, fy + 2000, fy)
+    quarter = as_int(parts[1].fillna(parts[5]))
+    end_fy = as_int(parts[2].fillna(parts[9]))
+    end_fy = np.where(end_fy < 100, end_fy + 2000, end_fy)
+    end_fy = np.where(np.isnan(end_fy), fy, end_fy)
+    end_quarter = as_int(parts[3].fillna(parts[4]).fillna(parts[6]).fillna(parts[8]))
+    end_quarter = np.where(np.isnan(end_quarter), quarter, end_quarter)
+
+    ordinal = fy * 4 + quarter - 1
+    end_ordinal = np.fmax(ordinal, end_fy * 4 + end_quarter - 1)
+    parsed = ~np.isnan(ordinal)
+    blank = (uniques.fillna('').str.strip() == '').to_numpy(dtype=bool)
+
+    start = ordinal_start_dates(ordinal)
+
+    labels = np.array([
+        _span_label(int(o), int(e)) if ok else None
+        for o, e, ok in zip(ordinal, end_ordinal, parsed)
+    ], dtype=object)
+
+    # Append a sentinel slot so NA codes (-1) map to the missing/fill value
+    def take(values, fill):
+        return np.append(values, np.array([fill], dtype=values.dtype))[codes]
+
+    result = pd.DataFrame({
+        'fy': pd.array(take(fy, np.nan), dtype='Int64'),
+        'quarter': pd.array(take(quarter, np.nan), dtype='Int64'),
+        'ordinal': pd.array(take(ordinal, np.nan), dtype='Int64'),
+        'end_ordinal': pd.array(take(end_ordinal, np.nan), dtype='Int64'),
+        'start_date': take(start, np.datetime64('NaT')),
+        'label': take(labels, None),
+        'error': take(~parsed & ~blank, False),
+    }, index=series.index)
+    return result
@@ -0,0 +1,248 @@
+import argparse
+import json
+import os
+import numpy as np
+import pandas as pd
+import convert_csv
+import quarter_parser
+import roadmap_table
+import schema_inference
+from build_cache import BuildCache
+from convert_csv import CSV_FILE, SIGNATURE_FIELDS, roadmap_signature
+from quarter_parser import ordinal_to_label
+from roadmap_table import load_roadmap_table
+
+ANALYTICS_FILE = 'roadmap_analytics.npz'
+ANALYTICS_JS_FILE = 'roadmap_analytics.js'
+
+# Cross-tab axes, in array order
+DIMENSIONS = ('quarter', 'category', 'priority', 'productManager')
+# Items in these lifecycle stages no longer load their product manager
+DONE_STATUSES = ('Live',)
+
+
+class RoadmapAnalytics:
+    """Item counts over quarter x product group x priority x product manager.
+
+    ``items[q, g, p]`` counts items over the contiguous quarter range (empty
+    quarters included) and the distinct groups and priorities. Items can have
+    several product managers ('Ana Lasa,Kristi Mai'), so ``counts[q, g, p, m]``
+    counts item/manager assignments: an item shared by two managers loads
+    both. ``labels`` names every index. ``active[q, m]`` counts the items a
+    manager still has in flight (not yet Live) that launch in quarter q, and
+    ``status_counts`` the items per lifecycle stage. ``source_count`` and
+    ``signature`` identify the rows it was computed from (roadmap_signature),
+    so the dashboard only trusts it for exactly that data.
+    """
+
+    def __init__(self, labels, items, counts, active, status_labels, status_counts, source_count=0, signature=''):
+        self.labels = labels
+        self.items = items
+        self.counts = counts
+        self.active = active
+        self.status_labels = status_labels
+        self.status_counts = status_counts
+        self.source_count = source_count
+        self.signature = signature
+
+    @property
+    def total(self):
+        return int(self.items.sum())
+
+    def by(self, *dims):
+        """Marginal counts over ``dims`` (in the given order), e.g. by('quarter', 'category')
+
+        Marginals over productManager count assignments; all others count items.
+        """
+        axes = [DIMENSIONS.index(d) for d in dims]
+        source = self.counts if 'productManager' in dims else self.items
+        other = tuple(i for i in range(source.ndim) if i not in axes)
+        summed = source.sum(axis=other)
+        # sum() keeps the remaining axes in DIMENSIONS order; reorder to the requested one
+        return np.transpose(summed, np.argsort(np.argsort(axes)))
+
+    def manager_load(self):
+        """(quarter x manager) items launching per quarter, all and in flight"""
+        return self.by('quarter', 'productManager'), self.active
+
+    def peak_load(self, top=5):
+        """[(manager, peak in-flight items, quarter)] for the most loaded managers"""
+        if self.active.shape[0] == 0:
+            return []  # no parseable quarters
+        peaks = self.active.max(axis=0)
+        peak_quarters = self.active.argmax(axis=0)
+        order = np.argsort(-peaks, kind='stable')[:top]
+        return [(self.labels['productManager'][m], int(peaks[m]), self.labels['quarter'][peak_quarters[m]])
+                for m in order if peaks[m]]
+
+    def _marginal(self, dim):
+        counts = self.by(dim)
+        return {label: int(n) for label, n in zip(self.labels[dim], counts) if n}
+
+    def summary(self):
+        """Small JSON-able marginals for the dashboard's executive summary"""
+        return {
+            'count': self.source_count,
+            'signature': self.signature,
+            'byQuarter': self._marginal('quarter'),
+            'byCategory': self._marginal('category'),
+            'byPriority': self._marginal('priority'),
+            'byStatus': {label: int(n) for label, n in zip(self.status_labels, self.status_counts) if n},
+            'peakLoad': [{'manager': m, 'items': n, 'quarter': q} for m, n, q in self.peak_load()],
+        }
+
+    def save(self, path=ANALYTICS_FILE):
+        tmp = path + '.tmp.npz'
+        np.savez(tmp, items=self.items, counts=self.counts, active=self.active, status_counts=self.status_counts,
+                 status_labels=np.array(self.status_labels, dtype=str), source_count=self.source_count,
+                 signature=np.array(self.signature),
+                 **{f"labels_{dim}": np.array(self.labels[dim], dtype=str) for dim in DIMENSIONS})
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path=ANALYTICS_FILE):
+        with np.load(path) as data:
+            labels = {dim: data[f"labels_{dim}"].tolist() for dim in DIMENSIONS}
+            return cls(labels, data['items'], data['counts'], data['active'], data['status_labels'].tolist(),
+                       data['status_counts'], int(data['source_count']), str(data['signature']))
+
+
+def _codes(values):
+    codes, uniques = pd.factorize(values.astype(str), sort=True)
+    return codes, [str(u) for u in uniques]
+
+
+def _split_managers(table):
+    """One row per (item, product manager); 'Ana Lasa, Ana Lasa' counts once. Index = item position."""
+    names = table['productManager'].astype(str).str.split(',').map(
+        lambda parts: list(dict.fromkeys(part.strip() for part in parts)))
+    return names.explode()
+
+
+def compute_analytics(table):
+    """Build RoadmapAnalytics from a normalized roadmap table in one vectorized pass"""
+    fields = table[list(SIGNATURE_FIELDS)].astype(object).fillna('').astype(str)
+    source_count, signature = len(table), roadmap_signature(fields.to_dict('records'))
+    table = table[table['quarter_ordinal'].notna()].reset_index(drop=True)
+    ordinals = table['quarter_ordinal'].to_numpy(dtype=np.int64)
+    first = int(ordinals.min()) if len(ordinals) else 0
+    n_quarters = int(ordinals.max()) - first + 1 if len(ordinals) else 0
+
+    labels = {'quarter': [ordinal_to_label(o) for o in range(first, first + n_quarters)]}
+    indexes = [ordinals - first]
+    for dim in DIMENSIONS[1:-1]:
+        codes, labels[dim] = _codes(table[dim])
+        indexes.append(codes)
+    item_shape = tuple(len(labels[dim]) for dim in DIMENSIONS[:-1])
+
+    managers = _split_managers(table)
+    rows = managers.index.to_numpy()
+    manager_codes, labels['productManager'] = _codes(managers)
+    shape = item_shape + (len(labels['productManager']),)
+    in_flight = ~table['status'].astype(str).isin(DONE_STATUSES).to_numpy()
+
+    if int(np.prod(shape)):
+        flat = np.ravel_multi_index(indexes, item_shape)
+        items = np.bincount(flat, minlength=int(np.prod(item_shape))).astype(np.int32).reshape(item_shape)
+        flat = np.ravel_multi_index([index[rows] for index in indexes] + [manager_codes], shape)
+        counts = np.bincount(flat, minlength=int(np.prod(shape))).astype(np.int32).reshape(shape)
+        load_index = indexes[0][rows] * shape[-1] + manager_codes
+        active = np.bincount(load_index[in_flight[rows]], minlength=shape[0] * shape[-1]).astype(np.int32)
+        active = active.reshape(shape[0], shape[-1])
+    else:
+        items = np.zeros(item_shape, dtype=np.int32)
+        counts = np.zeros(shape, dtype=np.int32)
+        active = np.zeros((shape[0], shape[-1]), dtype=np.int32)
+    status_codes, status_labels = _codes(table['status'])
+    status_counts = np.bincount(status_codes, minlength=len(status_labels)).astype(np.int32)
+    return RoadmapAnalytics(labels, items, counts, active, status_labels, status_counts, source_count, signature)
+
+
+def _item_ids(table):
+    """Vectorized roadmap_delta.assign_item_ids: product|title, '#group' and then '#n' on repeats"""
+    def norm(column):
+        return table[column].astype(str).str.replace(r'\s+', ' ', regex=True).str.strip().str.lower()
+    base = norm('product') + '|' + norm('title')
+    key = base.where(~base.duplicated(keep=False), base + '#' + norm('category'))
+    repeat = key.groupby(key).cumcount() + 1
+    return key.where(repeat == 1, key + '#' + repeat.astype(str))
+
+
+def quarter_slippage(previous, current):
+    """Items whose launch quarter moved between two snapshots of the normalized table.
+
+    Returns one row per moved item with the old and new quarter and ``shift``
+    in quarters (positive = slipped later, negative = pulled in).
+    """
+    before = pd.DataFrame({'id': _item_ids(previous).to_numpy(),
+                           'from_ordinal': previous['quarter_ordinal'].to_numpy()})
+    after = pd.DataFrame({'id': _item_ids(current).to_numpy(),
+                          'title': current['title'].astype(str).to_numpy(),
+                          'category': current['category'].astype(str).to_numpy(),
+                          'to_ordinal': current['quarter_ordinal'].to_numpy()})
+    moved = after.merge(before, on='id').dropna(subset=['from_ordinal', 'to_ordinal'])
+    moved = moved.astype({'from_ordinal': np.int64, 'to_ordinal': np.int64})
+    moved['shift'] = moved['to_ordinal'] - moved['from_ordinal']
+    moved = moved[moved['shift'] != 0].reset_index(drop=True)
+    moved['from_quarter'] = [ordinal_to_label(o) for o in moved['from_ordinal']]
+    moved['to_quarter'] = [ordinal_to_label(o) for o in moved['to_ordinal']]
+    return moved[['id', 'title', 'category', 'from_quarter', 'to_quarter', 'shift']]
+
+
+def write_analytics_js(analytics, path=ANALYTICS_JS_FILE):
+    """Write the summary marginals as `const roadmapAnalytics = {...};` for the dashboard"""
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write("const roadmapAnalytics = ")
+        json.dump(analytics.summary(), f, separators=(',', ':'))
+        f.write(";")
+    os.replace(tmp, path)
+    return path
+
+
+def load_analytics(data_file=CSV_FILE, cache=None, js_file=ANALYTICS_JS_FILE, table=None):
+    """Analytics for ``data_file``, recomputed only when the source (or this code) changed.
+
+    ``table`` is ``data_file`` already loaded as the normalized table, to avoid reading it again.
+    """
+    if cache is None:
+        cache = BuildCache()
+    outputs = [ANALYTICS_FILE] + ([js_file] if js_file else [])
+    # roadmap_table / schema_inference decide which columns are read, convert_csv the signature
+    key = cache.key('analytics', inputs=[data_file, __file__, quarter_parser.__file__, roadmap_table.__file__,
+                                         schema_inference.__file__, convert_csv.__file__],
+                    settings={'dimensions': DIMENSIONS, 'done': DONE_STATUSES, 'js': bool(js_file)})
+    if cache.restore(key, outputs) is not None:
+        return RoadmapAnalytics.load(ANALYTICS_FILE)
+    analytics = compute_analytics(load_roadmap_table(data_file) if table is None else table)
+    analytics.save(ANALYTICS_FILE)
+    if js_file:
+        write_analytics_js(analytics, js_file)
+    cache.store(key, outputs)
+    return analytics
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Capacity and load analytics over the roadmap")
+    parser.add_argument('data_file', nargs='?', default=CSV_FILE)
+    parser.add_argument('--previous', help="earlier snapshot of the roadmap to report quarter slippage against")
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+
+    analytics = load_analytics(args.data_file, cache=BuildCache(enabled=not args.no_cache))
+    print(f"📊 {analytics.total} items across {len(analytics.labels['quarter'])} quarters, "
+          f"{len(analytics.labels['category'])} product groups, {len(analytics.labels['productManager'])} managers")
+    print("\nItems per quarter:")
+    for quarter, count in analytics.summary()['byQuarter'].items():
+        print(f"  {quarter}: {count}")
+    print("\nMost loaded product managers (in-flight items in one quarter):")
+    for manager, items, quarter in analytics.peak_load():
+        print(f"  {manager}: {items} in {quarter}")
+
+    if args.previous:
+        moved = quarter_slippage(load_roadmap_table(args.previous), load_roadmap_table(args.data_file))
+        slipped = moved[moved['shift'] > 0]
+        print(f"\n↘ {len(slipped)} items slipped, {len(moved) - len(slipped)} pulled in since {args.previous}")
+        for row in moved.itertuples():
+            print(f"  {row.title}: {row.from_quarter} → {row.to_quarter}")
@@ -0,0 +1,72 @@
+import argparse
+import importlib
+import sys
+from collections import Counter
+from build_cache import BuildCache
+from convert_csv import CSV_FILE, iter_roadmap_items, quarter_sort_key
+
+# Single entry point for the roadmap scripts:
+#   python roadmap_cli.py convert [--batch DIR]    Excel workbook(s) -> roadmap_data.csv
+#   python roadmap_cli.py csv2js [csv_file]        timeline CSV export -> roadmap_data.js
+#   python roadmap_cli.py render [--no-cache]      static PNG charts
+#   python roadmap_cli.py summary [csv_file]       item counts per quarter, stage and group
+# pandas, NumPy and matplotlib are imported only by the subcommands that use
+# them, so csv2js and summary start without paying for them.
+
+# subcommand -> (module whose main(argv) handles it, help text)
+DELEGATED = {
+    'convert': ('data_converter', "convert the roadmap workbook (or --batch of workbooks) to CSV"),
+    'csv2js': ('convert_csv', "convert the timeline CSV export to roadmap_data.js"),
+}
+
+
+def render(args):
+    import roadmap_visualizer
+    roadmap_visualizer.main(cache=BuildCache(enabled=not args.no_cache))
+
+
+def summary(args):
+    """Counts straight from the CSV export; no pandas needed"""
+    quarters, statuses, groups = Counter(), Counter(), Counter()
+    for item in iter_roadmap_items(args.csv_file):
+        quarters[item['quarter']] += 1
+        statuses[item['status'] or '(Blank)'] += 1
+        for group in item['category'].split(','):
+            groups[group.strip() or '(Blank)'] += 1
+
+    print(f"📊 {sum(quarters.values())} roadmap items in {args.csv_file}")
+    print("\nBy quarter:")
+    for quarter, count in sorted(quarters.items(), key=quarter_sort_key):
+        print(f"  {quarter or '(Blank)'}: {count}")
+    print("\nBy lifecycle stage:")
+    for status, count in statuses.most_common():
+        print(f"  {status}: {count}")
+    print(f"\nTop {args.top} product groups:")
+    for group, count in groups.most_common(args.top):
+        print(f"  {group}: {count}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Me@Sams roadmap tools")
+    sub = parser.add_subparsers(dest='command', required=True)
+    for name, (module, help_text) in DELEGATED.items():
+        # Options are parsed by the module itself, so `csv2js -h` shows its own help
+        sub.add_parser(name, help=help_text, add_help=False)
+    render_parser = sub.add_parser('render', help="render the timeline, quarterly and capacity charts")
+    render_parser.add_argument('--no-cache', action='store_true', help="always re-render, ignoring the build cache")
+    render_parser.set_defaults(handler=render)
+    summary_parser = sub.add_parser('summary', help="print item counts per quarter, lifecycle stage and group")
+    summary_parser.add_argument('csv_file', nargs='?', default=CSV_FILE)
+    summary_parser.add_argument('--top', type=int, default=10)
+    summary_parser.set_defaults(handler=summary)
+
+    args, rest = parser.parse_known_args(argv)
+    if args.command in DELEGATED:
+        return importlib.import_module(DELEGATED[args.command][0]).main(rest)
+    if rest:
+        parser.error(f"unrecognized arguments: {' '.join(rest)}")
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+import json
+import os
+import re
+import time
+from collections import Counter
+
+UPDATES_DIR = 'roadmap_updates'
+MAX_DELTAS = 50
+
+
+def _normalize_key_part(value):
+    return re.sub(r'\s+', ' ', str(value or '')).strip().lower()
+
+
+def item_base_id(item):
+    """Stable identity of a roadmap item: product + title, case/whitespace-insensitive.
+
+    Kept deliberately simple so roadmap_patch.js derives the same ID for data
+    embedded without IDs (see roadmapItemId there).
+    """
+    return f"{_normalize_key_part(item.get('product'))}|{_normalize_key_part(item.get('title'))}"
+
+
+def assign_item_ids(items):
+    """Yield items with an 'id' field.
+
+    A product+title pair listed more than once is told apart by its product
+    group ('base#well-being') rather than by row position, so deleting a
+    duplicate in another group does not renumber the others. The quarter is
+    deliberately left out: it is the field slippage queries track by ID. Rows
+    that still collide get '#2', '#3', ... in row order.
+    """
+    items = list(items)
+    bases = [item_base_id(item) for item in items]
+    repeated = Counter(bases)
+    seen = {}
+    for item, base in zip(items, bases):
+        item_id = base
+        if repeated[base] > 1:
+            item_id = f"{base}#{_normalize_key_part(item.get('category'))}"
+        seen[item_id] = seen.get(item_id, 0) + 1
+        if seen[item_id] > 1:
+            item_id = f"{item_id}#{seen[item_id]}"
+        yield {'id': item_id, **{k: v for k, v in item.items() if k != 'id'}}
+
+
+def diff_items(previous, current):
+    """Changeset between two {id: item} maps"""
+    added = [item for item_id, item in current.items() if item_id not in previous]
+    changed = [item for item_id, item in current.items()
+               if item_id in previous and previous[item_id] != item]
+    removed = [item_id for item_id in previous if item_id not in current]
+    return {'added': added, 'changed': changed, 'removed': removed}
+
+
+def _read_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _write_json(path, payload):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, separators=(',', ':'))
+    os.replace(tmp, path)
+
+
+def publish_updates(items, updates_dir=UPDATES_DIR, max_deltas=MAX_DELTAS):
+    """Publish a new build of the roadmap as a changeset against the previous build.
+
+    Writes into ``updates_dir``:
+      snapshot.json          full item list (with IDs) at the latest version
+      delta-<version>.json   added/changed/removed items going from version-1 to version
+      manifest.json          latest version plus the deltas still available
+    Returns the manifest entry for the new delta, or None when nothing changed.
+    """
+    os.makedirs(updates_dir, exist_ok=True)
+    snapshot_file = os.path.join(updates_dir, 'snapshot.json')
+    manifest_file = os.path.join(updates_dir, 'manifest.json')
+
+    snapshot = _read_json(snapshot_file, {'version': 0, 'items': []})
+    manifest = _read_json(manifest_file, {'version': snapshot['version'], 'deltas': []})
+    previous = {item['id']: item for item in snapshot['items']}
+    current_items = list(assign_item_ids(items))
+    current = {item['id']: item for item in current_items}
+
+    changes = diff_items(previous, current)
+    if not any(changes.values()) and snapshot['version']:
+        return None
+
+    version = snapshot['version'] + 1
+    delta_name = f"delta-{version:06d}.json"
+    _write_json(os.path.join(updates_dir, delta_name),
+                {'from': snapshot['version'], 'to': version, **changes})
+    entry = {
+        'from': snapshot['version'],
+        'to': version,
+        'file': delta_name,
+        'added': len(changes['added']),
+        'changed': len(changes['changed']),
+        'removed': len(changes['removed']),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+    deltas = manifest['deltas'] + [entry]
+    # Snapshot first: a client that sees the new manifest must be able to fetch it
+    _write_json(snapshot_file, {'version': version, 'items': current_items})
+    _write_json(manifest_file, {'version': version, 'deltas': deltas[-max_deltas:]})
+    # Prune only once no published manifest lists the old deltas any more
+    for stale in deltas[:-max_deltas]:
+        try:
+            os.remove(os.path.join(updates_dir, stale['file']))
+        except OSError:
+            pass
+    return entry
+
+
+if __name__ == "__main__":
+    import sys
+    from convert_csv import CSV_FILE, iter_roadmap_items
+
+    csv_file = sys.argv[1] if len(sys.argv) > 1 else CSV_FILE
+    entry = publish_updates(iter_roadmap_items(csv_file))
+    if entry is None:
+        print("No roadmap changes since the last build")
+    else:
+        print(f"Published roadmap v{entry['to']}: "
+              f"{entry['added']} added, {entry['changed']} changed, {entry['removed']} removed")
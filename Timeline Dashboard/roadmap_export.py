@@ -0,0 +1,142 @@
+import matplotlib
+matplotlib.use('Agg')  # headless: never open windows, never block on plt.show()
+
+import argparse
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib.pyplot as plt
+
+from convert_csv import CSV_FILE
+from roadmap_table import load_roadmap_table
+from roadmap_visualizer import RoadmapVisualizer
+
+EXPORT_DIR = 'roadmap_exports'
+FORMATS = ('png', 'svg', 'pdf')
+CHART_COLUMNS = ['title', 'quarter', 'category', 'status', 'quarter_ordinal']
+
+# view name -> (output subdirectory, table column to split on, whether cells are comma-joined lists)
+VIEWS = {
+    'group': ('by_group', 'category', True),
+    'quarter': ('by_quarter', 'quarter', False),
+    'leader': ('by_leader', 'productLeader', True),
+}
+
+
+def slugify(value):
+    """File-name-safe version of a product group / quarter / leader name"""
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', str(value)).strip('_')
+    return slug or 'unassigned'
+
+
+def load_roadmap(data_file):
+    """Load any supported roadmap source as the normalized roadmap table"""
+    return load_roadmap_table(data_file)
+
+
+def plan_exports(table, views=tuple(VIEWS), formats=FORMATS, out_dir=EXPORT_DIR):
+    """One task per (view, key): the rows to draw plus one target path per format"""
+    tasks = []
+    for view in views:
+        subdir, column, multi = VIEWS[view]
+        values = table[column].astype(str)
+        if multi:
+            # Items listed under several product groups / leaders appear in each of them
+            values = values.str.split(',')
+        keyed = table[CHART_COLUMNS].assign(_key=values).explode('_key')
+        keyed['_key'] = keyed['_key'].str.strip()
+        # 'A, A' or 'A,A ' lists an item once per distinct name
+        keyed = keyed[~keyed.set_index('_key', append=True).index.duplicated()]
+        for key, rows in keyed.groupby('_key', sort=True, observed=True):
+            files = [os.path.join(out_dir, subdir, f"{slugify(key)}.{fmt}") for fmt in formats]
+            tasks.append({'view': view, 'key': key, 'formats': list(formats), 'files': files,
+                          'rows': rows.drop(columns='_key')})
+    return tasks
+
+
+def render_task(task, dpi):
+    """Worker: build the task's figure once and write it atomically in every requested format"""
+    started = time.perf_counter()
+    visualizer = RoadmapVisualizer()
+    fig = visualizer.create_timeline_chart(sample_data=task['rows'])
+    fig.suptitle(f"{task['key']}", fontsize=12)
+    build_seconds = time.perf_counter() - started
+    figures = []
+    try:
+        for fmt, path in zip(task['formats'], task['files']):
+            saved = time.perf_counter()
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.tmp"
+            fig.savefig(tmp, format=fmt, dpi=dpi, bbox_inches='tight')
+            os.replace(tmp, path)
+            figures.append({
+                'view': task['view'],
+                'key': task['key'],
+                'format': fmt,
+                'file': path,
+                'items': len(task['rows']),
+                'bytes': os.path.getsize(path),
+                'render_seconds': round(build_seconds + time.perf_counter() - saved, 4),
+            })
+    finally:
+        plt.close(fig)
+    return figures
+
+
+def export_views(data_file=CSV_FILE, out_dir=EXPORT_DIR, views=tuple(VIEWS), formats=FORMATS,
+                 dpi=300, max_workers=None):
+    """Render every requested view across a process pool and write export_manifest.json"""
+    started = time.perf_counter()
+    table = load_roadmap(data_file)
+    tasks = plan_exports(table, views=views, formats=formats, out_dir=out_dir)
+    print(f"Rendering {sum(len(task['files']) for task in tasks)} figures ({len(tasks)} charts) "
+          f"from {len(table)} roadmap items...")
+
+    figures = []
+    failures = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(render_task, task, dpi): task for task in tasks}
+        for future in as_completed(futures):
+            task = futures[future]
+            try:
+                figures.extend(future.result())
+            except Exception as e:
+                failures.extend({'view': task['view'], 'key': task['key'], 'format': fmt, 'error': str(e)}
+                                for fmt in task['formats'])
+
+    figures.sort(key=lambda f: f['file'])
+    manifest = {
+        'source': data_file,
+        'dpi': dpi,
+        'generated': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'total_seconds': round(time.perf_counter() - started, 3),
+        'figures': figures,
+        'failures': failures,
+    }
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_file = os.path.join(out_dir, 'export_manifest.json')
+    with open(manifest_file + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_file + '.tmp', manifest_file)
+
+    print(f"✓ {len(figures)} figures written to {out_dir} in {manifest['total_seconds']}s")
+    if failures:
+        print(f"⚠ {len(failures)} figures failed; see {manifest_file}")
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Headless export of roadmap charts per product group, quarter and leader")
+    parser.add_argument('data_file', nargs='?', default=CSV_FILE)
+    parser.add_argument('-o', '--output', default=EXPORT_DIR)
+    parser.add_argument('--views', default=','.join(VIEWS), help="comma-separated subset of: group, quarter, leader")
+    parser.add_argument('--formats', default=','.join(FORMATS), help="comma-separated subset of: png, svg, pdf")
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    export_views(args.data_file, args.output, views=args.views.split(','), formats=args.formats.split(','),
+                 dpi=args.dpi, max_workers=args.workers)
@@ -0,0 +1,228 @@
+import argparse
+import hashlib
+import json
+import os
+from datetime import date
+import numpy as np
+from convert_csv import CSV_FILE, COLUMN_MAPPING, iter_roadmap_items
+from quarter_parser import ordinal_to_label, parse_quarter
+from roadmap_delta import assign_item_ids
+
+HISTORY_FILE = 'roadmap_history.npz'
+FIELDS = ['id'] + list(COLUMN_MAPPING)
+
+
+def _row_hash(item):
+    encoded = json.dumps([item.get(field, '') for field in FIELDS], separators=(',', ':'))
+    return hashlib.sha1(encoded.encode('utf-8')).digest()[:16]
+
+
+def _as_date(value):
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+
+class RoadmapHistory:
+    """Append-only roadmap snapshots in a dictionary-encoded columnar layout.
+
+    Every distinct item version (content hash over all fields) is stored
+    once as a row of int32 codes into per-field dictionaries, plus its
+    quarter ordinal. A snapshot is just the list of row numbers it contains,
+    so a day where nothing changed costs one int32 per item and nothing else.
+    """
+
+    def __init__(self, path=HISTORY_FILE):
+        self.path = path
+        self.dictionaries = {field: [] for field in FIELDS}
+        self._lookup = {field: {} for field in FIELDS}
+        self.codes = {field: np.zeros(0, dtype=np.int32) for field in FIELDS}
+        self.ordinals = np.zeros(0, dtype=np.int32)
+        self.row_hashes = np.zeros((0, 16), dtype=np.uint8)
+        self.snapshot_dates = np.zeros(0, dtype='datetime64[D]')
+        self.snapshot_offsets = np.zeros(1, dtype=np.int64)
+        self.snapshot_rows = np.zeros(0, dtype=np.int32)
+        if os.path.exists(path):
+            self._load()
+
+    # ---- persistence -------------------------------------------------------
+    def _load(self):
+        with np.load(self.path) as data:
+            for field in FIELDS:
+                self.dictionaries[field] = data[f"dict_{field}"].tolist()
+                self._lookup[field] = {value: i for i, value in enumerate(self.dictionaries[field])}
+                self.codes[field] = data[f"col_{field}"]
+            self.ordinals = data['quarter_ordinal']
+            self.row_hashes = data['row_hash']
+            self.snapshot_dates = data['snapshot_dates']
+            self.snapshot_offsets = data['snapshot_offsets']
+            self.snapshot_rows = data['snapshot_rows']
+
+    def save(self):
+        tmp = self.path + '.tmp.npz'
+        np.savez_compressed(tmp, quarter_ordinal=self.ordinals, row_hash=self.row_hashes,
+                            snapshot_dates=self.snapshot_dates, snapshot_offsets=self.snapshot_offsets,
+                            snapshot_rows=self.snapshot_rows,
+                            **{f"dict_{field}": np.array(self.dictionaries[field], dtype=str) for field in FIELDS},
+                            **{f"col_{field}": self.codes[field] for field in FIELDS})
+        os.replace(tmp, self.path)
+
+    # ---- writing -----------------------------------------------------------
+    def _encode(self, field, value):
+        lookup = self._lookup[field]
+        code = lookup.get(value)
+        if code is None:
+            code = lookup[value] = len(self.dictionaries[field])
+            self.dictionaries[field].append(value)
+        return code
+
+    def append(self, items, as_of=None):
+        """Record ``items`` as the roadmap on ``as_of`` (default today).
+
+        Rows already stored are referenced, not copied. A second snapshot on
+        the same date replaces the first; a snapshot identical to the latest
+        one is not stored. Returns the number of new distinct rows, or None
+        when nothing was recorded.
+        """
+        as_of = np.datetime64(_as_date(as_of or date.today()), 'D')
+        if len(self.snapshot_dates) and as_of < self.snapshot_dates[-1]:
+            raise ValueError(f"Snapshots must be appended in date order (latest is {self.snapshot_dates[-1]})")
+
+        known = {h.tobytes(): i for i, h in enumerate(self.row_hashes)}
+        rows, new_rows = [], []
+        for item in assign_item_ids(items):
+            digest = _row_hash(item)
+            row = known.get(digest)
+            if row is None:
+                row = known[digest] = len(self.row_hashes) + len(new_rows)
+                new_rows.append((digest, item))
+            rows.append(row)
+        rows = np.array(rows, dtype=np.int32)
+
+        replace_last = len(self.snapshot_dates) and as_of == self.snapshot_dates[-1]
+        if not new_rows and len(self.snapshot_dates) and not replace_last and \
+                np.array_equal(rows, self.snapshot(len(self.snapshot_dates) - 1)):
+            return None
+
+        if new_rows:
+            for field in FIELDS:
+                added = np.array([self._encode(field, item.get(field, '')) for _, item in new_rows], dtype=np.int32)
+                self.codes[field] = np.concatenate([self.codes[field], added])
+            spans = [parse_quarter(item['quarter']) for _, item in new_rows]
+            self.ordinals = np.concatenate([self.ordinals, np.array(
+                [span.ordinal if span else -1 for span in spans], dtype=np.int32)])
+            digests = np.frombuffer(b''.join(d for d, _ in new_rows), dtype=np.uint8).reshape(-1, 16)
+            self.row_hashes = np.concatenate([self.row_hashes, digests])
+
+        if replace_last:
+            self.snapshot_rows = self.snapshot_rows[:self.snapshot_offsets[-2]]
+            self.snapshot_offsets = self.snapshot_offsets[:-1]
+            self.snapshot_dates = self.snapshot_dates[:-1]
+        self.snapshot_rows = np.concatenate([self.snapshot_rows, rows])
+        self.snapshot_offsets = np.append(self.snapshot_offsets, len(self.snapshot_rows))
+        self.snapshot_dates = np.append(self.snapshot_dates, as_of)
+        if replace_last:
+            self._drop_orphans()
+        self.save()
+        return len(new_rows)
+
+    def _drop_orphans(self):
+        """Remove rows (and dictionary values) no snapshot refers to any more, e.g. after a same-day replace"""
+        referenced = np.zeros(len(self.row_hashes), dtype=bool)
+        referenced[self.snapshot_rows] = True
+        if referenced.all():
+            return
+        keep = np.flatnonzero(referenced)
+        remap = np.full(len(referenced), -1, dtype=np.int32)
+        remap[keep] = np.arange(len(keep), dtype=np.int32)
+        self.snapshot_rows = remap[self.snapshot_rows]
+        self.ordinals = self.ordinals[keep]
+        self.row_hashes = self.row_hashes[keep]
+        for field in FIELDS:
+            codes = self.codes[field][keep]
+            used, codes = np.unique(codes, return_inverse=True)
+            self.codes[field] = codes.astype(np.int32).reshape(-1)
+            self.dictionaries[field] = [self.dictionaries[field][i] for i in used]
+            self._lookup[field] = {value: i for i, value in enumerate(self.dictionaries[field])}
+
+    # ---- queries -----------------------------------------------------------
+    def snapshot(self, index):
+        return self.snapshot_rows[self.snapshot_offsets[index]:self.snapshot_offsets[index + 1]]
+
+    def _index_as_of(self, when):
+        """Index of the latest snapshot taken on or before ``when``"""
+        index = np.searchsorted(self.snapshot_dates, np.datetime64(_as_date(when), 'D'), side='right') - 1
+        if index < 0:
+            raise LookupError(f"No roadmap snapshot on or before {when}")
+        return int(index)
+
+    def _decode(self, rows, fields=FIELDS):
+        columns = {field: np.array(self.dictionaries[field], dtype=object)[self.codes[field][rows]]
+                   for field in fields}
+        return [dict(zip(fields, values)) for values in zip(*columns.values())]
+
+    def as_of(self, when):
+        """Roadmap items as they stood on ``when`` (date or 'YYYY-MM-DD')"""
+        return self._decode(self.snapshot(self._index_as_of(when)))
+
+    def _matched(self, start, end):
+        """Row numbers of the items present in both snapshots, aligned by item ID"""
+        before = self.snapshot(self._index_as_of(start))
+        after = self.snapshot(self._index_as_of(end))
+        _, i, j = np.intersect1d(self.codes['id'][before], self.codes['id'][after],
+                                 assume_unique=True, return_indices=True)
+        return before[i], after[j]
+
+    def changed_between(self, start, end, field):
+        """Items whose ``field`` (e.g. 'status') differs between the two dates"""
+        before, after = self._matched(start, end)
+        moved = self.codes[field][before] != self.codes[field][after]
+        old_values = np.array(self.dictionaries[field], dtype=object)[self.codes[field][before[moved]]]
+        return [dict(item, previous=old) for item, old in zip(self._decode(after[moved]), old_values)]
+
+    def slipped_between(self, start, end):
+        """Items whose launch quarter moved later between the two dates, largest slip first"""
+        before, after = self._matched(start, end)
+        old, new = self.ordinals[before], self.ordinals[after]
+        slipped = (old >= 0) & (new > old)
+        order = np.argsort(old[slipped] - new[slipped], kind='stable')
+        items = self._decode(after[slipped][order], fields=['id', 'title', 'category', 'status'])
+        for item, o, n in zip(items, old[slipped][order], new[slipped][order]):
+            item.update(from_quarter=ordinal_to_label(o), to_quarter=ordinal_to_label(n), shift=int(n - o))
+        return items
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record and query roadmap snapshots over time")
+    parser.add_argument('--history', default=HISTORY_FILE)
+    sub = parser.add_subparsers(dest='command', required=True)
+    record = sub.add_parser('record', help="append the current CSV export as a snapshot")
+    record.add_argument('csv_file', nargs='?', default=CSV_FILE)
+    record.add_argument('--as-of', default=None, help="snapshot date (YYYY-MM-DD), default today")
+    as_of = sub.add_parser('as-of', help="print the roadmap as it stood on a date")
+    as_of.add_argument('date')
+    slipped = sub.add_parser('slipped', help="items whose quarter slipped between two dates")
+    slipped.add_argument('start')
+    slipped.add_argument('end')
+    args = parser.parse_args()
+
+    history = RoadmapHistory(args.history)
+    if args.command == 'record':
+        added = history.append(iter_roadmap_items(args.csv_file), args.as_of)
+        if added is None:
+            print("No changes since the latest snapshot; nothing recorded")
+        else:
+            print(f"✓ Recorded snapshot {history.snapshot_dates[-1]} ({added} new item versions, "
+                  f"{len(history.row_hashes)} stored across {len(history.snapshot_dates)} snapshots)")
+    else:
+        try:
+            if args.command == 'as-of':
+                items = history.as_of(args.date)
+                print(f"{len(items)} items as of {args.date}:")
+                for item in items:
+                    print(f"  [{item['quarter']}] {item['title']} ({item['status']})")
+            else:
+                items = history.slipped_between(args.start, args.end)
+                print(f"{len(items)} items slipped between {args.start} and {args.end}:")
+                for item in items:
+                    print(f"  {item['title']}: {item['from_quarter']} → {item['to_quarter']} (+{item['shift']}Q)")
+        except LookupError as e:
+            print(f"❌ {e}")
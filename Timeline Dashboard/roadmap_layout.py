@@ -0,0 +1,145 @@
+import argparse
+import json
+import os
+from convert_csv import CSV_FILE, iter_roadmap_items, quarter_sort_key, roadmap_signature
+
+LAYOUT_JS_FILE = 'roadmap_layout.js'
+
+# Must match quarterColors in Me@Sams_strategy.html
+QUARTER_COLORS = {
+    'FY2026 Q1': '#d8eaff',
+    'FY2026 Q2': '#d5f3e6',
+    'FY2026 Q3': '#f0dcfb',
+    'FY2026 Q4': '#ffe4cc',
+    'FY2027 Q1': '#e2f2d8',
+    'FY2027 Q2': '#e2e0ff',
+    'FY2027 Q3': '#ffd6e8',
+    'FY2027 Q4': '#e8f5f6',
+}
+DARK_TEXT = '#132533'
+LIGHT_TEXT = '#FFFFFF'
+
+# Roadmap bars are one quarter wide (--quarter-gap 140px less padding), which
+# fits about 16 characters of the .6rem bold label per line
+LABEL_CHARS_PER_LINE = 16
+LABEL_MAX_LINES = 5
+# Approximate bar geometry in px, only used to pick each lane's tallest quarter
+LINE_PX = 11
+BAR_CHROME_PX = 27
+
+
+def _luminance(hex_color):
+    """WCAG relative luminance of '#rgb' / '#rrggbb'"""
+    hex_color = hex_color.lstrip('#')
+    if len(hex_color) == 3:
+        hex_color = ''.join(c * 2 for c in hex_color)
+    channels = [int(hex_color[i:i + 2], 16) / 255 for i in (0, 2, 4)]
+    r, g, b = [c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4 for c in channels]
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+def contrast_ratio(c1, c2):
+    l1, l2 = _luminance(c1), _luminance(c2)
+    return (max(l1, l2) + 0.05) / (min(l1, l2) + 0.05)
+
+
+def best_text_color(bg):
+    """Same choice as the dashboard's bestTextColor: the higher-contrast text color, preferring 4.5:1"""
+    if not bg.startswith('#'):
+        return DARK_TEXT  # CSS variables cannot be resolved here; the dashboard falls back to dark too
+    c_light, c_dark = contrast_ratio(bg, LIGHT_TEXT), contrast_ratio(bg, DARK_TEXT)
+    if c_light >= c_dark and c_light >= 4.5:
+        return LIGHT_TEXT
+    if c_dark >= 4.5:
+        return DARK_TEXT
+    return LIGHT_TEXT if c_light > c_dark else DARK_TEXT
+
+
+def wrap_label(title, width=LABEL_CHARS_PER_LINE, max_lines=LABEL_MAX_LINES):
+    """(label, lines): the title greedily wrapped at spaces, cut to ``max_lines`` lines ending in '…'"""
+    lines = []
+    for word in title.split():
+        if lines and len(lines[-1]) + 1 + len(word) <= width:
+            lines[-1] += ' ' + word
+        else:
+            lines.append(word)  # a word longer than a line overflows it (clipped by the dashboard)
+    if len(lines) > max_lines:
+        lines = lines[:max_lines]
+        last = lines[-1].split(' ')
+        while len(last) > 1 and len(' '.join(last)) + 2 > width:
+            last.pop()
+        lines[-1] = ' '.join(last) + ' …'
+    return ' '.join(lines), max(len(lines), 1)
+
+
+def compute_layout(items):
+    """Swimlane layout of the dashboard's roadmap view, aligned with roadmapData positions.
+
+    Lanes are product groups; within a lane items are ordered by quarter and
+    title, and each gets a stacking slot within its quarter column plus the
+    number of label lines above it, so the dashboard can place every bar
+    without measuring or sorting anything.
+    """
+    items = list(items)
+    quarters = sorted({item['quarter'] for item in items}, key=lambda q: quarter_sort_key((q, 0)))
+    quarter_index = {q: i for i, q in enumerate(quarters)}
+
+    labels, lines = [], []
+    for item in items:
+        label, n_lines = wrap_label(item['title'])
+        labels.append(label)
+        lines.append(n_lines)
+
+    # Titles sort by UTF-16 code units, the dashboard fallback's plain string comparison
+    by_lane = {}
+    for position, item in enumerate(items):
+        by_lane.setdefault(item['category'], []).append(position)
+
+    lanes = []
+    for name in sorted(by_lane):
+        positions = sorted(by_lane[name], key=lambda p: (quarter_index[items[p]['quarter']],
+                                                        items[p]['title'].encode('utf-16-be'), p))
+        slots, above = [], []
+        stacked = {}  # quarter -> (bars, label lines) stacked so far
+        for position in positions:
+            q = quarter_index[items[position]['quarter']]
+            bars, used = stacked.get(q, (0, 0))
+            slots.append(bars)
+            above.append(used)
+            stacked[q] = (bars + 1, used + lines[position])
+        depth = max(stacked.values(), key=lambda s: s[0] * BAR_CHROME_PX + s[1] * LINE_PX)
+        lanes.append({'name': name, 'items': positions, 'slots': slots, 'above': above, 'depth': list(depth)})
+
+    return {
+        'count': len(items),
+        'signature': roadmap_signature(items),
+        'quarters': quarters,
+        'textColors': {q: best_text_color(QUARTER_COLORS.get(q, 'var(--primary)')) for q in quarters},
+        'q': [quarter_index[item['quarter']] for item in items],
+        'labels': labels,
+        'lines': lines,
+        'lanes': lanes,
+    }
+
+
+def write_layout_js(layout, path=LAYOUT_JS_FILE):
+    """Write the layout as `const roadmapLayout = {...};` for the static dashboard"""
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        f.write("const roadmapLayout = ")
+        json.dump(layout, f, ensure_ascii=False, separators=(',', ':'))
+        f.write(";")
+    os.replace(tmp, path)
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute the dashboard's roadmap swimlane layout")
+    parser.add_argument('csv_file', nargs='?', default=CSV_FILE)
+    parser.add_argument('-o', '--output', default=LAYOUT_JS_FILE)
+    args = parser.parse_args()
+
+    layout = compute_layout(iter_roadmap_items(args.csv_file))
+    write_layout_js(layout, args.output)
+    print(f"✓ Wrote layout for {layout['count']} items in {len(layout['lanes'])} lanes "
+          f"across {len(layout['quarters'])} quarters to {args.output}")
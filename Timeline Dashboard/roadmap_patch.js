@@ -0,0 +1,91 @@
+// Roadmap delta loader: keeps the dashboard's roadmapData array current by applying
+// the changesets published by roadmap_delta.py (roadmap_updates/manifest.json, delta-*.json).
+// Only the deltas since the last synced version are downloaded; a full snapshot is
+// fetched only when the local copy is too old or has never been synced.
+(function(global){
+  const STORAGE_KEY = 'roadmapData.synced';
+
+  function normKey(v){ return String(v == null ? '' : v).replace(/\s+/g, ' ').trim().toLowerCase(); }
+
+  // Must match roadmap_delta.item_base_id / assign_item_ids
+  function roadmapItemId(item){ return normKey(item.product) + '|' + normKey(item.title); }
+
+  // Duplicated product+title pairs are told apart by product group, then by '#n'
+  function ensureIds(data){
+    const repeated = {}, seen = {};
+    data.forEach(it=>{ const base = roadmapItemId(it); repeated[base] = (repeated[base] || 0) + 1; });
+    data.forEach(it=>{
+      const base = roadmapItemId(it);
+      let id = repeated[base] > 1 ? base + '#' + normKey(it.category) : base;
+      seen[id] = (seen[id] || 0) + 1;
+      if(seen[id] > 1) id += '#' + seen[id];
+      if(!it.id) it.id = id;
+    });
+    return data;
+  }
+
+  // Apply one {added, changed, removed} changeset in place (array identity is preserved)
+  function applyRoadmapPatch(data, delta){
+    const index = new Map(data.map((it, i)=>[it.id, i]));
+    const upsert = it=>{
+      const i = index.get(it.id);
+      if(i != null){ data[i] = it; } else { index.set(it.id, data.length); data.push(it); }
+    };
+    (delta.changed || []).forEach(upsert);
+    (delta.added || []).forEach(upsert);
+    if(delta.removed && delta.removed.length){
+      const gone = new Set(delta.removed);
+      let w = 0;
+      for(let r = 0; r < data.length; r++){ if(!gone.has(data[r].id)) data[w++] = data[r]; }
+      data.length = w;
+    }
+    return data;
+  }
+
+  function replaceAll(data, items){ data.length = 0; items.forEach(it=>data.push(it)); }
+
+  function loadStored(){
+    try { return JSON.parse(global.localStorage.getItem(STORAGE_KEY) || 'null'); } catch(e){ return null; }
+  }
+  function store(version, data){
+    try { global.localStorage.setItem(STORAGE_KEY, JSON.stringify({version, items: data})); } catch(e){ /* quota / file:// */ }
+  }
+
+  // Resolves to {version, changed}; `changed` means roadmapData was modified and views should re-render
+  async function syncRoadmapData(data, opts){
+    opts = opts || {};
+    const base = opts.baseUrl || 'roadmap_updates/';
+    const getJSON = f => fetch(base + f, {cache: 'no-cache'}).then(r=>{
+      if(!r.ok) throw new Error(f + ': HTTP ' + r.status);
+      return r.json();
+    });
+    ensureIds(data);
+    let version = opts.version || 0;
+    let changed = false;
+    const stored = loadStored();
+    if(stored && stored.version > version){ replaceAll(data, stored.items); version = stored.version; changed = true; }
+
+    let manifest;
+    try { manifest = await getJSON('manifest.json'); } catch(e){ return {version, changed}; }
+    if(manifest.version === version) return {version, changed};
+
+    const chain = manifest.deltas.filter(d=>d.from >= version);
+    const contiguous = version > 0 && chain.length && chain[0].from === version &&
+      chain.every((d, i)=> i === 0 || d.from === chain[i - 1].to) &&
+      chain[chain.length - 1].to === manifest.version;
+    let target = manifest.version;
+    if(contiguous){
+      for(const d of chain){ applyRoadmapPatch(data, await getJSON(d.file)); }
+    } else {
+      const snap = await getJSON('snapshot.json');
+      replaceAll(data, snap.items);
+      target = snap.version;
+    }
+    store(target, data);
+    return {version: target, changed: true};
+  }
+
+  global.roadmapItemId = roadmapItemId;
+  global.applyRoadmapPatch = applyRoadmapPatch;
+  global.syncRoadmapData = syncRoadmapData;
+})(window);
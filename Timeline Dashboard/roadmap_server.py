@@ -0,0 +1,334 @@
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+from convert_csv import CSV_FILE, iter_roadmap_items
+from quarter_parser import parse_quarter
+from roadmap_delta import UPDATES_DIR, assign_item_ids, publish_updates
+from roadmap_store import FACETS, RoadmapStore
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+DEFAULT_PORT = 8765
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# LIMIT/OFFSET are bound as SQLite 64-bit integers
+MAX_SQL_INTEGER = 2 ** 63 - 1
+MAX_CACHED_RESPONSES = 512
+MAX_HEADER_BYTES = 16 * 1024
+STATIC_EXTENSIONS = {'.html', '.js', '.css', '.json', '.png', '.svg', '.jpg'}
+
+# One encoded representation of a response body
+Payload = namedtuple('Payload', ['body', 'content_type', 'etag', 'gzip', 'br'])
+
+
+class HTTPError(Exception):
+    """An error response: HTTP status and the message sent as {"error": ...}"""
+
+    def __init__(self, status, message):
+        super().__init__(status, message)
+        self.status = status
+        self.message = message
+
+
+def make_payload(body, content_type, tag):
+    """Compress once up front; every later request is served from these bytes"""
+    return Payload(
+        body=body,
+        content_type=content_type,
+        etag=f'"{tag}"',
+        gzip=gzip.compress(body, compresslevel=6, mtime=0) if len(body) > 512 else None,
+        br=brotli.compress(body) if brotli and len(body) > 512 else None,
+    )
+
+
+def load_source_items(source):
+    """Roadmap items (roadmap_data.js fields) from the CSV export or the Excel workbook"""
+    if source.endswith('.xlsx'):
+        import pandas as pd
+        from roadmap_table import normalize_roadmap
+        table = normalize_roadmap(pd.read_excel(source)).drop(columns='quarter_ordinal')
+        return table.astype(str).to_dict('records')
+    return list(iter_roadmap_items(source))
+
+
+class RoadmapSnapshot:
+    """Immutable view of one load of the source: items, their store and the data hash"""
+
+    def __init__(self, source):
+        self.items = list(assign_item_ids(load_source_items(source)))
+        self.data_hash = hashlib.sha256(
+            json.dumps(self.items, sort_keys=True, separators=(',', ':')).encode('utf-8')).hexdigest()
+        # Built in a reload thread, queried on the event loop
+        self.store = RoadmapStore(':memory:', check_same_thread=False)
+        self.store.replace_items(self.items)
+        self.loaded = time.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+class RoadmapService:
+    """Roadmap JSON API over a hot-reloaded snapshot of the source file.
+
+    GET /api/version                 data hash, item count, load time
+    GET /api/items?page=&page_size=  paginated items; any facet (category, status,
+                                     priority, quarter, productManager, productLeader)
+                                     filters, e.g. &status=Live&quarter=FY26%20Q2
+    GET /api/facets                  per-facet counts and item positions (roadmap_index.js format)
+    GET /<file>                      the dashboard and its scripts from ``static_dir``
+                                     (dot-directories such as .roadmap_cache are never served)
+
+    Responses carry a strong ETag derived from the data hash; If-None-Match gets 304.
+    Each new snapshot is also published as a changeset into ``updates_dir``
+    (default <static_dir>/roadmap_updates), which the served dashboard's
+    roadmap_patch.js applies when the page is loaded or refreshed.
+    """
+
+    def __init__(self, source=CSV_FILE, static_dir='.', poll_interval=1.0, updates_dir=None):
+        self.source = source
+        self.static_dir = os.path.abspath(static_dir)
+        self.updates_dir = os.path.join(self.static_dir, UPDATES_DIR) if updates_dir is None else updates_dir
+        self.poll_interval = poll_interval
+        self.snapshot = None
+        self._source_stamp = None
+        self._responses = OrderedDict()
+        # Requests are resolved in worker threads; one at a time touches the store and the cache
+        self._lock = threading.Lock()
+
+    def _stamp(self):
+        st = os.stat(self.source)
+        return st.st_size, st.st_mtime_ns
+
+    def load_if_changed(self):
+        """New snapshot when the source file changed since the last load, else None (runs in a thread)"""
+        stamp = self._stamp()
+        if stamp == self._source_stamp:
+            return None
+        snapshot = RoadmapSnapshot(self.source)
+        self._source_stamp = stamp
+        if self.snapshot is not None and snapshot.data_hash == self.snapshot.data_hash:
+            return None
+        if self.updates_dir:
+            publish_updates(snapshot.items, self.updates_dir)
+        return snapshot
+
+    def install(self, snapshot):
+        """Swap in a snapshot; cached responses of the previous data are dropped"""
+        with self._lock:
+            self.snapshot = snapshot
+            self._responses.clear()
+
+    async def watch(self):
+        """Poll the source and swap in a new snapshot when it changes"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                snapshot = await loop.run_in_executor(None, self.load_if_changed)
+            except Exception as e:
+                # Keep serving the last good snapshot (e.g. a half-saved workbook)
+                print(f"⚠ Reload of {self.source} failed: {e}")
+                continue
+            if snapshot is not None:
+                await asyncio.to_thread(self.install, snapshot)
+                print(f"↻ Reloaded {self.source}: {len(snapshot.items)} items")
+
+    def _cached(self, key, build):
+        """Payload for ``key`` from the LRU cache, or built and cached (JSON and static alike)"""
+        payload = self._responses.get(key)
+        if payload is None:
+            payload = build()
+            self._responses[key] = payload
+            if len(self._responses) > MAX_CACHED_RESPONSES:
+                self._responses.popitem(last=False)
+        else:
+            self._responses.move_to_end(key)
+        return payload
+
+    def _json_payload(self, key, build):
+        def encode():
+            body = json.dumps(build(), separators=(',', ':')).encode('utf-8')
+            tag = hashlib.sha256(f"{self.snapshot.data_hash}\x00{key}".encode('utf-8')).hexdigest()[:32]
+            return make_payload(body, 'application/json; charset=utf-8', tag)
+        return self._cached(key, encode)
+
+    def _items_page(self, params):
+        try:
+            page = max(1, int(params.pop('page', 1)))
+            page_size = min(MAX_PAGE_SIZE, max(1, int(params.pop('page_size', DEFAULT_PAGE_SIZE))))
+        except ValueError:
+            raise HTTPError(400, "page and page_size must be integers")
+        if (page - 1) * page_size > MAX_SQL_INTEGER:
+            raise HTTPError(400, "page out of range")
+        filters = {facet: value for facet, value in params.items() if facet in FACETS}
+        unknown = set(params) - set(filters)
+        if unknown:
+            raise HTTPError(400, f"unknown filters: {', '.join(sorted(unknown))}")
+        if 'quarter' in filters and parse_quarter(filters['quarter']) is None:
+            raise HTTPError(400, f"unrecognized quarter: {filters['quarter']}")
+
+        def build():
+            store = self.snapshot.store
+            total = store.count(**filters)
+            items = store.query(limit=page_size, offset=(page - 1) * page_size, **filters)
+            return {
+                'data_hash': self.snapshot.data_hash,
+                'total': total,
+                'page': page,
+                'page_size': page_size,
+                'pages': (total + page_size - 1) // page_size,
+                'items': items,
+            }
+        key = 'items?' + '&'.join(f"{k}={v}" for k, v in sorted(filters.items())) + f"&page={page}&size={page_size}"
+        return self._json_payload(key, build)
+
+    def _static(self, path):
+        rel = os.path.normpath(unquote(path).lstrip('/')) or '.'
+        full = os.path.join(self.static_dir, rel)
+        # Also keeps '..' out, and caches such as .roadmap_cache/index.json (absolute local paths)
+        hidden = any(part.startswith('.') for part in rel.split(os.sep))
+        if hidden or os.path.splitext(full)[1].lower() not in STATIC_EXTENSIONS \
+                or not os.path.isfile(full):
+            raise HTTPError(404, "not found")
+        st = os.stat(full)
+        key = f"static:{rel}:{st.st_size}:{st.st_mtime_ns}"
+
+        def read():
+            with open(full, 'rb') as f:
+                body = f.read()
+            content_type = mimetypes.guess_type(full)[0] or 'application/octet-stream'
+            if content_type.startswith('text/') or content_type.endswith('javascript'):
+                content_type += '; charset=utf-8'
+            return make_payload(body, content_type, hashlib.sha256(body).hexdigest()[:32])
+        return self._cached(key, read)
+
+    def resolve(self, target):
+        """Payload for a request target; raises HTTPError. Blocking: SQLite queries and compression"""
+        with self._lock:
+            return self._resolve(target)
+
+    def _resolve(self, target):
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        if url.path == '/api/version':
+            return self._json_payload('version', lambda: {
+                'data_hash': self.snapshot.data_hash,
+                'count': len(self.snapshot.items),
+                'loaded': self.snapshot.loaded,
+                'source': os.path.basename(self.source),
+            })
+        if url.path == '/api/items':
+            return self._items_page(params)
+        if url.path == '/api/facets':
+            return self._json_payload('facets', self.snapshot.store.facet_index)
+        if url.path == '/':
+            return self._static('Me@Sams_strategy.html')
+        return self._static(url.path)
+
+    async def handle(self, reader, writer):
+        """HTTP/1.1 connection loop (GET/HEAD, keep-alive)"""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                writer.write(await self._respond(method, target, headers, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def _respond(self, method, target, headers, keep_alive):
+        status, extra, body = 200, {}, b''
+        if method not in ('GET', 'HEAD'):
+            status, extra = 405, {'Allow': 'GET, HEAD'}
+            payload = make_payload(b'{"error":"method not allowed"}', 'application/json', 'error')
+        else:
+            try:
+                payload = await asyncio.to_thread(self.resolve, target)
+            except HTTPError as e:
+                status = e.status
+                payload = make_payload(json.dumps({'error': e.message}).encode('utf-8'), 'application/json', 'error')
+            except Exception as e:
+                # Answer instead of dropping the connection; the cause goes to the server log
+                print(f"⚠ {method} {target} failed: {type(e).__name__}: {e}")
+                status = 500
+                payload = make_payload(b'{"error":"internal server error"}', 'application/json', 'error')
+
+        accepted = headers.get('accept-encoding', '')
+        body, encoding, suffix = payload.body, None, ''
+        if payload.br is not None and 'br' in accepted:
+            body, encoding, suffix = payload.br, 'br', '-br'
+        elif payload.gzip is not None and 'gzip' in accepted:
+            body, encoding, suffix = payload.gzip, 'gzip', '-gz'
+        # Strong ETag per representation; any representation of the same data validates
+        etag = payload.etag[:-1] + suffix + '"'
+        if status == 200:
+            extra['ETag'] = etag
+            extra['Cache-Control'] = 'no-cache'
+            extra['Vary'] = 'Accept-Encoding'
+            sent = {tag.strip().removeprefix('W/').strip('"').split('-')[0]
+                    for tag in headers.get('if-none-match', '').split(',')}
+            if payload.etag.strip('"') in sent:
+                status, body = 304, b''
+        if encoding and status == 200:
+            extra['Content-Encoding'] = encoding
+
+        reason = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+                  405: 'Method Not Allowed', 500: 'Internal Server Error'}[status]
+        lines = [f"HTTP/1.1 {status} {reason}",
+                 f"Content-Type: {payload.content_type}",
+                 f"Content-Length: {len(body) if status != 304 else 0}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines += [f"{name}: {value}" for name, value in extra.items()]
+        head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+        return head if method == 'HEAD' or status == 304 else head + body
+
+
+async def serve(source=CSV_FILE, host='127.0.0.1', port=DEFAULT_PORT, static_dir='.', poll_interval=1.0,
+                updates_dir=None):
+    service = RoadmapService(source, static_dir=static_dir, poll_interval=poll_interval, updates_dir=updates_dir)
+    service.install(service.load_if_changed())
+    server = await asyncio.start_server(service.handle, host, port, limit=MAX_HEADER_BYTES)
+    print(f"🌐 Serving {len(service.snapshot.items)} roadmap items from {source} at http://{host}:{port}/")
+    print(f"   Watching {source} for changes (every {poll_interval}s)")
+    async with server:
+        await asyncio.gather(server.serve_forever(), service.watch())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the roadmap dashboard and JSON API with hot reload")
+    parser.add_argument('source', nargs='?', default=CSV_FILE, help="roadmap CSV export or .xlsx workbook")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--static-dir', default='.')
+    parser.add_argument('--poll', type=float, default=1.0, help="seconds between source change checks")
+    parser.add_argument('--updates', default=None,
+                        help="changeset directory for the dashboard (default <static-dir>/roadmap_updates, '' to skip)")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.source, args.host, args.port, args.static_dir, args.poll, updates_dir=args.updates))
+    except KeyboardInterrupt:
+        print("\nStopped")
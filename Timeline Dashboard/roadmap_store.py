@@ -0,0 +1,176 @@
+import argparse
+import json
+import os
+import sqlite3
+from convert_csv import CSV_FILE, COLUMN_MAPPING, iter_roadmap_items, roadmap_signature
+from quarter_parser import parse_quarter
+from roadmap_delta import assign_item_ids
+
+STORE_FILE = 'roadmap_store.db'
+INDEX_JS_FILE = 'roadmap_index.js'
+
+ITEM_FIELDS = list(COLUMN_MAPPING)
+# Dashboard filter -> indexed store column
+FACETS = {
+    'category': 'category',
+    'status': 'status',
+    'priority': 'priority',
+    'quarter': 'quarter_ordinal',
+    'productManager': 'productManager',
+    'productLeader': 'productLeader',
+}
+# Facets whose cells are comma-joined lists ('Ana Lasa,Kristi Mai'); each name is
+# indexed on its own in item_facets, as roadmap_analytics and roadmap_export split them
+MULTI_VALUE_FACETS = ('category', 'productManager', 'productLeader')
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS items (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    {', '.join(f'{field} TEXT NOT NULL' for field in ITEM_FIELDS)},
+    quarter_ordinal INTEGER
+);
+{''.join(f'CREATE INDEX IF NOT EXISTS idx_items_{column} ON items ({column});' for column in FACETS.values())}
+CREATE TABLE IF NOT EXISTS item_facets (
+    facet TEXT NOT NULL,
+    value TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (facet, value, position)
+) WITHOUT ROWID;
+"""
+
+
+def split_facet_values(value):
+    """'Ana Lasa, Kristi Mai,Ana Lasa' -> ['Ana Lasa', 'Kristi Mai']; an empty cell stays ['']"""
+    names = dict.fromkeys(part.strip() for part in str(value or '').split(','))
+    names.pop('', None)
+    return list(names) or ['']
+
+
+class RoadmapStore:
+    """SQLite-backed roadmap items with an index per dashboard filter.
+
+    ``position`` is the item's offset in the exported roadmapData array, so
+    facet ID lists can be used directly as array indexes by the dashboard.
+    """
+
+    def __init__(self, path=STORE_FILE, check_same_thread=True):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=check_same_thread)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def replace_items(self, items):
+        """Replace the stored items with ``items`` (in roadmapData order); returns the count"""
+        rows, facet_rows = [], []
+        for position, item in enumerate(assign_item_ids(items)):
+            span = parse_quarter(item['quarter'])
+            rows.append((position, item['id'], *(item.get(field, '') for field in ITEM_FIELDS),
+                         span.ordinal if span else None))
+            facet_rows += [(facet, value, position) for facet in MULTI_VALUE_FACETS
+                           for value in split_facet_values(item.get(facet))]
+        placeholders = ', '.join('?' * (len(ITEM_FIELDS) + 3))
+        with self.conn:
+            self.conn.execute("DELETE FROM items")
+            self.conn.execute("DELETE FROM item_facets")
+            self.conn.executemany(f"INSERT INTO items VALUES ({placeholders})", rows)
+            self.conn.executemany("INSERT INTO item_facets VALUES (?, ?, ?)", facet_rows)
+        return len(rows)
+
+    def _where(self, filters):
+        clauses, params = [], []
+        for facet, value in filters.items():
+            if facet not in FACETS:
+                raise ValueError(f"Unknown roadmap filter '{facet}' (use one of: {', '.join(FACETS)})")
+            if facet == 'quarter' and not isinstance(value, int):
+                span = parse_quarter(value)
+                if span is None:
+                    # Matching quarter_ordinal IS NULL would silently return the unparsed rows instead
+                    raise ValueError(f"Unrecognized quarter '{value}' (e.g. FY26 Q2)")
+                value = span.ordinal
+            if facet in MULTI_VALUE_FACETS:
+                # 'Sunaina Basa' matches 'Muneeb Fallaha,Sunaina Basa'
+                clauses.append("position IN (SELECT position FROM item_facets WHERE facet = ? AND value = ?)")
+                params += [facet, value]
+                continue
+            clauses.append(f"{FACETS[facet]} IS ?")
+            params.append(value)
+        return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), params
+
+    def query(self, limit=None, offset=0, **filters):
+        """Items matching every filter (e.g. status='Live', quarter='FY26 Q2'), in roadmapData order.
+
+        ``limit``/``offset`` select one page of the matches in SQL.
+        """
+        where, params = self._where(filters)
+        page = ''
+        if limit is not None:
+            page = " LIMIT ? OFFSET ?"
+            params = [*params, limit, offset]
+        cursor = self.conn.execute(
+            f"SELECT id, {', '.join(ITEM_FIELDS)} FROM items{where} ORDER BY position{page}", params)
+        return [dict(zip(['id'] + ITEM_FIELDS, row)) for row in cursor]
+
+    def count(self, **filters):
+        where, params = self._where(filters)
+        return self.conn.execute(f"SELECT COUNT(*) FROM items{where}", params).fetchone()[0]
+
+    def facet_index(self):
+        """Per-facet value -> positions, plus value order and counts, for set-intersection filtering"""
+        index = {'count': self.count(), 'signature': roadmap_signature(self.query()),
+                 'facets': {}, 'counts': {}, 'order': {}}
+        for facet, column in FACETS.items():
+            if facet in MULTI_VALUE_FACETS:
+                cursor = self.conn.execute(
+                    "SELECT value, GROUP_CONCAT(position) FROM item_facets WHERE facet = ? GROUP BY value ORDER BY value",
+                    (facet,))
+            else:
+                # Quarter facets are keyed by label but ordered by fiscal ordinal
+                label = 'quarter' if facet == 'quarter' else column
+                order_by = 'MIN(quarter_ordinal)' if facet == 'quarter' else label
+                cursor = self.conn.execute(
+                    f"SELECT {label}, GROUP_CONCAT(position) FROM items GROUP BY {label} ORDER BY {order_by}, {label}")
+            ids = {value: sorted(int(p) for p in positions.split(',')) for value, positions in cursor}
+            index['facets'][facet] = ids
+            index['counts'][facet] = {value: len(positions) for value, positions in ids.items()}
+            index['order'][facet] = list(ids)
+        return index
+
+    def write_index_js(self, path=INDEX_JS_FILE):
+        """Write the facet index as `const roadmapIndex = {...};` for the static dashboard"""
+        tmp = path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write("const roadmapIndex = ")
+            json.dump(self.facet_index(), f, separators=(',', ':'))
+            f.write(";")
+        os.replace(tmp, path)
+        return path
+
+
+def build_store(csv_file=CSV_FILE, store_file=STORE_FILE, index_file=INDEX_JS_FILE):
+    """Load the CSV export into the item store and export its facet index"""
+    with RoadmapStore(store_file) as store:
+        count = store.replace_items(iter_roadmap_items(csv_file))
+        if index_file:
+            store.write_index_js(index_file)
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the indexed roadmap item store and the dashboard facet index")
+    parser.add_argument('csv_file', nargs='?', default=CSV_FILE)
+    parser.add_argument('--store', default=STORE_FILE)
+    parser.add_argument('-o', '--output', default=INDEX_JS_FILE)
+    args = parser.parse_args()
+
+    count = build_store(args.csv_file, args.store, args.output)
+    print(f"✓ Stored {count} roadmap items in {args.store}")
+    print(f"✓ Wrote facet index to {args.output}")
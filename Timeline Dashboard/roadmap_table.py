@@ -0,0 +1,101 @@
+import os
+import pandas as pd
+from convert_csv import COLUMN_MAPPING
+from quarter_parser import parse_quarter_series
+from schema_inference import infer_schema
+
+TABLE_FORMATS = {'.arrow': 'arrow', '.feather': 'arrow', '.parquet': 'parquet'}
+
+# Low-cardinality columns stored dictionary-encoded
+CATEGORICAL_COLUMNS = ['category', 'status', 'priority', 'product', 'itemType', 'productManager', 'productLeader']
+
+
+def normalize_roadmap(df, pinned=None):
+    """Map a raw roadmap export (Excel/CSV headers) to the typed roadmap table.
+
+    Columns use the same field names as roadmap_data.js, quarter labels are
+    normalized to 'FY2026 Q1' form, and ``quarter_ordinal`` carries the parsed
+    fiscal quarter so downstream readers never re-parse quarter text. Source
+    columns are resolved by schema_inference; ``pinned`` overrides it per field.
+    """
+    schema = infer_schema(df, pinned=pinned)
+    table = pd.DataFrame(index=df.index)
+    for field in COLUMN_MAPPING:
+        source = schema.get(field)
+        values = df[source] if source is not None else pd.Series('', index=df.index)
+        table[field] = values.astype('string').fillna('').str.strip()
+
+    table = table[table['quarter'] != ''].reset_index(drop=True)
+    parsed = parse_quarter_series(table['quarter'])
+    table['quarter'] = parsed['label'].fillna(table['quarter']).astype('string')
+    table['quarter_ordinal'] = parsed['ordinal'].astype('Int32')
+    for field in CATEGORICAL_COLUMNS:
+        table[field] = table[field].astype('category')
+    return table
+
+
+def is_roadmap_export(df):
+    """True if a raw frame carries the export's title and quarter headers"""
+    headers = {str(col).strip() for col in df.columns}
+    return COLUMN_MAPPING['title'] in headers and COLUMN_MAPPING['quarter'] in headers
+
+
+def _table_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in TABLE_FORMATS:
+        raise ValueError(f"Unsupported roadmap table format '{ext}' (use .arrow or .parquet)")
+    return TABLE_FORMATS[ext]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError("Columnar roadmap tables need pyarrow: pip install pyarrow") from None
+
+
+def write_roadmap_table(table, path):
+    """Write the normalized table as uncompressed Arrow IPC (memory-mappable) or Parquet"""
+    _require_pyarrow()
+    import pyarrow as pa
+
+    arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+    tmp = path + '.tmp'
+    if _table_format(path) == 'arrow':
+        import pyarrow.feather as feather
+        feather.write_feather(arrow_table, tmp, compression='uncompressed')
+    else:
+        import pyarrow.parquet as pq
+        pq.write_table(arrow_table, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def read_roadmap_table(path, columns=None):
+    """Load a roadmap table; Arrow files are memory-mapped so numeric and dictionary columns are not copied"""
+    _require_pyarrow()
+    import pyarrow as pa
+
+    if _table_format(path) == 'arrow':
+        with pa.memory_map(path, 'r') as source:
+            arrow_table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            arrow_table = arrow_table.select(columns)
+    else:
+        import pyarrow.parquet as pq
+        arrow_table = pq.read_table(path, columns=columns, memory_map=True)
+    return arrow_table.to_pandas()
+
+
+def is_roadmap_table(path):
+    """True if ``path`` has a columnar roadmap table extension"""
+    return os.path.splitext(str(path))[1].lower() in TABLE_FORMATS
+
+
+def load_roadmap_table(data_file):
+    """Load any supported roadmap source (Arrow/Parquet table, .xlsx, CSV export) as the normalized table"""
+    if is_roadmap_table(data_file):
+        return read_roadmap_table(data_file)
+    if str(data_file).endswith('.xlsx'):
+        return normalize_roadmap(pd.read_excel(data_file))
+    return normalize_roadmap(pd.read_csv(data_file, encoding='utf-8-sig', dtype=str, keep_default_na=False))
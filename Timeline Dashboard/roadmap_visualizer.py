@@ -2,15 +2,32 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from datetime import datetime, timedelta
-import seaborn as sns
 import numpy as np
 from matplotlib.patches import Rectangle
+from matplotlib.collections import PolyCollection
+import matplotlib.colors as mcolors
+from matplotlib import rcsetup
+import os
 import warnings
+from importlib.util import find_spec
+import quarter_parser
+import roadmap_analytics
+import roadmap_table
+import schema_inference
+from build_cache import BuildCache
+from pipeline_metrics import stage
+from quarter_parser import ordinal_start_dates, ordinal_to_label, parse_quarter, parse_quarter_series
+from roadmap_analytics import load_analytics
+from roadmap_table import (is_roadmap_export, is_roadmap_table, load_roadmap_table, normalize_roadmap,
+                           read_roadmap_table)
+from schema_inference import infer_schema
 warnings.filterwarnings('ignore')
 
 class RoadmapVisualizer:
-    def __init__(self):
+    def __init__(self, pinned_columns=None):
         self.fig_size = (16, 10)
+        self.pinned_columns = pinned_columns  # {role: column} overrides for schema inference
+        self.dpi = 300
         self.colors = {
             'Q1': '#FF6B6B',  # Red
             'Q2': '#4ECDC4',  # Teal
@@ -20,31 +37,38 @@ class RoadmapVisualizer:
             'Completed': '#A0A0A0'  # Gray
         }
         
+    def label_capacity(self, fontsize=8):
+        """How many one-line item labels fit vertically in the timeline axes"""
+        axes_height_pt = self.fig_size[1] * 72 * 0.75
+        return int(axes_height_pt / (fontsize * 1.4))
+    
+    def render_settings(self):
+        """Settings that change rendered output; part of the build cache key"""
+        return {'fig_size': self.fig_size, 'dpi': self.dpi, 'colors': self.colors}
+    
     def parse_quarter(self, quarter_str):
         """Parse quarter string like 'FY26 Q1' to datetime"""
-        try:
-            if pd.isna(quarter_str) or quarter_str == '':
-                return None
-            
-            # Handle different formats
-            if 'FY' in str(quarter_str) and 'Q' in str(quarter_str):
-                parts = str(quarter_str).replace('FY', '').strip().split()
-                fy_year = int(parts[0])
-                quarter = parts[1].replace('Q', '')
-                
-                # FY26 Q1 = Oct 2025, Q2 = Jan 2026, Q3 = Apr 2026, Q4 = Jul 2026
-                base_year = 2000 + fy_year - 1
-                quarter_months = {'1': 10, '2': 1, '3': 4, '4': 7}
-                
-                if quarter in ['2', '3', '4']:
-                    base_year += 1
-                    
-                month = quarter_months.get(quarter, 1)
-                return datetime(base_year, month, 1)
-            
-            return None
-        except:
-            return None
+        span = parse_quarter(quarter_str)
+        return span.start_date if span else None
+    
+    def _prepare_raw_frame(self, df):
+        """Resolve title/quarter columns in a raw export and parse quarters; (None, None) if not found"""
+        schema = infer_schema(df, pinned=self.pinned_columns)
+        title_col = schema['title']
+        quarter_col = schema['quarter']
+        
+        if not title_col or not quarter_col:
+            return None, None
+        
+        # Clean and prepare data
+        df = df.dropna(subset=[title_col, quarter_col])
+        parsed = parse_quarter_series(df[quarter_col])
+        if parsed['error'].any():
+            print(f"Skipping {int(parsed['error'].sum())} rows with unrecognized quarter values")
+        df = df.assign(parsed_date=parsed['start_date'], fiscal_quarter=parsed['quarter'])
+        df = df.dropna(subset=['parsed_date'])
+        
+        return df, title_col
     
     def create_timeline_chart(self, data_file=None, sample_data=None):
         """Create a timeline/Gantt chart style roadmap"""
@@ -54,78 +78,79 @@ class RoadmapVisualizer:
         elif data_file:
             # Try to read the data file
             try:
-                if data_file.endswith('.xlsx'):
-                    df = pd.read_excel(data_file)
-                elif data_file.endswith('.csv'):
-                    df = pd.read_csv(data_file)
-                else:
-                    raise ValueError("Unsupported file format")
+                with stage('timeline.load') as timing:
+                    if is_roadmap_table(data_file):
+                        df = read_roadmap_table(data_file, columns=['title', 'quarter', 'category', 'status', 'quarter_ordinal'])
+                    elif data_file.endswith('.xlsx'):
+                        df = pd.read_excel(data_file)
+                    elif data_file.endswith('.csv'):
+                        df = pd.read_csv(data_file)
+                    else:
+                        raise ValueError("Unsupported file format")
+                    timing.rows = len(df)
             except Exception as e:
                 print(f"Error reading file: {e}")
                 return self.create_sample_roadmap()
         else:
             return self.create_sample_roadmap()
         
-        # Standardize column names
-        df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
-        
-        # Try to identify relevant columns
-        title_col = None
-        quarter_col = None
-        category_col = None
-        status_col = None
-        
-        for col in df.columns:
-            if any(word in col for word in ['title', 'name', 'feature', 'initiative']):
-                title_col = col
-            elif any(word in col for word in ['quarter', 'q1', 'q2', 'q3', 'q4', 'launch', 'release']):
-                quarter_col = col
-            elif any(word in col for word in ['category', 'team', 'area', 'domain']):
-                category_col = col
-            elif any(word in col for word in ['status', 'state']):
-                status_col = col
-        
-        if not title_col or not quarter_col:
+        with stage('timeline.parse', rows=len(df)):
+            if 'quarter_ordinal' in df.columns:
+                # Normalized roadmap table: columns and quarter ordinals are already resolved
+                title_col = 'title'
+                df = df.dropna(subset=['quarter_ordinal'])
+                ordinals = df['quarter_ordinal'].to_numpy(dtype='float64')
+                df = df.assign(parsed_date=ordinal_start_dates(ordinals),
+                               fiscal_quarter=(ordinals % 4 + 1).astype(int))
+            else:
+                df, title_col = self._prepare_raw_frame(df)
+        if df is None:
             print("Could not identify required columns. Creating sample roadmap...")
             return self.create_sample_roadmap()
         
-        # Clean and prepare data
-        df = df.dropna(subset=[title_col, quarter_col])
-        df['parsed_date'] = df[quarter_col].apply(self.parse_quarter)
-        df = df.dropna(subset=['parsed_date'])
-        
         # Sort by date
         df = df.sort_values('parsed_date')
         
         # Create the visualization
         fig, ax = plt.subplots(figsize=self.fig_size)
+        n_items = len(df)
+        
+        # Bars for every item as one PolyCollection built from NumPy arrays
+        bar_height = 0.6
+        bar_days = 30
+        x = mdates.date2num(df['parsed_date'].to_numpy())
+        y = np.arange(n_items)
+        palette = mcolors.to_rgba_array(['#95A5A6'] + [self.colors[f"Q{q}"] for q in range(1, 5)], alpha=0.7)
+        fiscal_quarter = df['fiscal_quarter'].to_numpy(dtype=int)
+        fits_labels = n_items <= self.label_capacity()
         
-        # Set up the plot
-        y_pos = range(len(df))
-        
-        for i, (idx, row) in enumerate(df.iterrows()):
-            date = row['parsed_date']
-            title = row[title_col]
-            
-            # Determine color based on quarter
-            quarter = f"Q{((date.month - 1) // 3) + 1}"
-            color = self.colors.get(quarter, '#95A5A6')
-            
-            # Create bar for each item
-            bar_height = 0.6
-            rect = Rectangle((mdates.date2num(date), i - bar_height/2), 
-                           30, bar_height, 
-                           facecolor=color, alpha=0.7, edgecolor='black', linewidth=0.5)
-            ax.add_patch(rect)
-            
-            # Add text label
-            ax.text(mdates.date2num(date) + 15, i, title, 
-                   ha='center', va='center', fontsize=8, weight='bold')
-        
-        # Format the plot
-        ax.set_ylim(-0.5, len(df) - 0.5)
-        ax.set_yticks(y_pos)
-        ax.set_yticklabels([f"Item {i+1}" for i in range(len(df))])
+        verts = np.empty((n_items, 4, 2))
+        verts[:, [0, 1], 0] = x[:, None]
+        verts[:, [2, 3], 0] = (x + bar_days)[:, None]
+        verts[:, [0, 3], 1] = (y - bar_height/2)[:, None]
+        verts[:, [1, 2], 1] = (y + bar_height/2)[:, None]
+        ax.add_collection(PolyCollection(verts, facecolors=palette[fiscal_quarter],
+                                         edgecolors='black', linewidths=0.5 if fits_labels else 0))
+        
+        if n_items:
+            ax.set_xlim(x.min() - bar_days, x.max() + 4 * bar_days)
+        ax.set_ylim(-0.5, n_items - 0.5)
+        
+        if fits_labels:
+            # One label per item, as long as rows are tall enough to read
+            for i, title in enumerate(df[title_col].astype(str)):
+                ax.text(x[i] + bar_days/2, i, title, 
+                       ha='center', va='center', fontsize=8, weight='bold')
+            ax.set_yticks(y)
+            ax.set_yticklabels([f"Item {i+1}" for i in range(n_items)])
+        else:
+            # Too many rows to label individually: one count label per launch quarter
+            starts = np.flatnonzero(np.r_[True, x[1:] != x[:-1]]) if n_items else np.array([], dtype=int)
+            ends = np.r_[starts[1:], n_items]
+            for first, stop in zip(starts, ends):
+                ax.text(x[first] + bar_days * 1.5, (first + stop - 1) / 2, 
+                       f"{stop - first} items (Q{fiscal_quarter[first]})",
+                       ha='left', va='center', fontsize=9, weight='bold')
         
         # Format x-axis for dates
         ax.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
@@ -144,7 +169,11 @@ class RoadmapVisualizer:
                           for quarter, color in self.colors.items() if quarter.startswith('Q')]
         ax.legend(handles=legend_elements, loc='upper right')
         
-        plt.tight_layout()
+        if fits_labels:
+            plt.tight_layout()
+        else:
+            # tight_layout would measure every tick label; fixed margins are enough here
+            fig.subplots_adjust(left=0.08, right=0.97, bottom=0.12, top=0.92)
         return fig
     
     def create_sample_roadmap(self):
@@ -164,14 +193,31 @@ class RoadmapVisualizer:
         
         return self.create_timeline_chart(sample_data=sample_data)
     
-    def create_quarterly_view(self, data_file=None, sample_data=None):
-        """Create a quarterly breakdown view"""
-        
+    def _load_quarterly_frame(self, data_file=None, sample_data=None):
+        """Rows with title, quarter, category and quarter_ordinal for the quarterly views (None if no quarter column)"""
+        df = None
         if sample_data is not None:
             df = pd.DataFrame(sample_data)
-        else:
+        elif data_file:
+            try:
+                with stage('quarterly.load') as timing:
+                    if is_roadmap_table(data_file):
+                        df = read_roadmap_table(data_file, columns=['title', 'quarter', 'category', 'quarter_ordinal'])
+                        timing.rows = len(df)
+                        return df
+                    elif data_file.endswith('.xlsx'):
+                        df = pd.read_excel(data_file)
+                    elif data_file.endswith('.csv'):
+                        df = pd.read_csv(data_file, encoding='utf-8-sig')
+                    else:
+                        raise ValueError("Unsupported file format")
+                    timing.rows = len(df)
+            except Exception as e:
+                print(f"Error reading file: {e}")
+                df = None
+        if df is None:
             # Use sample data for demo
-            sample_data = [
+            df = pd.DataFrame([
                 {'title': 'Mobile App Enhancement', 'quarter': 'FY26 Q1', 'category': 'Technology'},
                 {'title': 'Member Rewards Program', 'quarter': 'FY26 Q1', 'category': 'Member Experience'},
                 {'title': 'Inventory Management System', 'quarter': 'FY26 Q2', 'category': 'Operations'},
@@ -180,70 +226,217 @@ class RoadmapVisualizer:
                 {'title': 'Sustainability Initiative', 'quarter': 'FY26 Q3', 'category': 'Corporate'},
                 {'title': 'Advanced Analytics Dashboard', 'quarter': 'FY26 Q4', 'category': 'Technology'},
                 {'title': 'Customer Service AI', 'quarter': 'FY26 Q4', 'category': 'Technology'},
-            ]
-            df = pd.DataFrame(sample_data)
+            ])
+        
+        if 'quarter_ordinal' in df.columns:
+            # Already a normalized roadmap table (e.g. loaded once by main())
+            return df[['title', 'quarter', 'category', 'quarter_ordinal']]
+        if is_roadmap_export(df):
+            return normalize_roadmap(df)
+        schema = infer_schema(df, pinned=self.pinned_columns)
+        if not schema['title'] or not schema['quarter']:
+            print("Could not identify title and quarter columns for the quarterly view")
+            return None
+        df = pd.DataFrame({
+            'title': df[schema['title']],
+            'quarter': df[schema['quarter']],
+            'category': df[schema['category']] if schema['category'] else '',
+        })
+        parsed = parse_quarter_series(df['quarter'])
+        return df.assign(quarter_ordinal=parsed['ordinal'])
+    
+    def _quarter_groups(self, df):
+        """(ordinal, rows) per quarter in chronological order, from a single groupby pass"""
+        if df is None:
+            return []
+        df = df.dropna(subset=['quarter_ordinal'])
+        return list(df.groupby(df['quarter_ordinal'].astype(int), sort=True))
+    
+    def _draw_quarter_panel(self, ax, ordinal, rows, max_items, slots, label_chars=40):
+        """List view of one quarter's items; anything past max_items collapses into a '+N more' row"""
+        shown = rows.head(max_items)
+        n_shown = len(shown)
+        extra = len(rows) - n_shown
+        color = self.colors.get(f"Q{ordinal % 4 + 1}", '#95A5A6')
+        
+        # Create colored bars in one call
+        ax.barh(np.arange(n_shown), 1, color=color, alpha=0.7, height=0.6)
+        for j, (title, category) in enumerate(zip(shown['title'].astype(str), shown['category'].astype(str))):
+            if len(title) > label_chars:
+                title = title[:label_chars - 1] + '…'
+            ax.text(0.5, j, f"{title}\n({category})", 
+                   ha='center', va='center', fontsize=9, weight='bold')
+        if extra:
+            ax.text(0.5, n_shown, f"+{extra} more", ha='center', va='center', fontsize=9, style='italic')
+        
+        ax.set_xlim(0, 1)
+        # Same number of slots in every panel keeps bar heights uniform across the grid
+        ax.set_ylim(slots - 0.5, -0.5)
+        ax.set_title(f'{ordinal_to_label(ordinal)} ({len(rows)} items)', fontsize=14, weight='bold')
+        ax.set_xticks([])
+        ax.set_yticks([])
         
-        # Group by quarter
-        quarters = df['quarter'].unique()
+        # Remove spines
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+    
+    def _quarterly_figure(self, groups, title, max_cols=4, max_items_per_quarter=25):
+        """Grid sized to the number of quarters (and items per quarter) it has to show"""
+        n_panels = max(len(groups), 1)
+        n_cols = min(max_cols, n_panels)
+        n_rows = -(-n_panels // n_cols)
+        tallest = max((min(len(rows), max_items_per_quarter + 1) for _, rows in groups), default=1)
+        panel_height = max(3, 0.55 * tallest)
         
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        fig, axes = plt.subplots(n_rows, n_cols, figsize=(4 * n_cols, 1.2 + n_rows * panel_height), squeeze=False)
         axes = axes.flatten()
+        for ax, (ordinal, rows) in zip(axes, groups):
+            self._draw_quarter_panel(ax, ordinal, rows, max_items_per_quarter, slots=tallest)
+        for ax in axes[len(groups):]:
+            ax.set_visible(False)
+        if not groups:
+            fig.text(0.5, 0.5, 'No items with a recognized launch quarter', ha='center', va='center')
+        
+        fig.suptitle(title, fontsize=18, weight='bold')
+        # Reserve a fixed band for the suptitle so it never collides with the first row of titles
+        fig.tight_layout(rect=(0, 0, 1, 1 - 0.8 / fig.get_figheight()))
+        return fig
+    
+    def create_quarterly_view(self, data_file=None, sample_data=None, max_cols=4, max_items_per_quarter=25):
+        """Create a quarterly breakdown view with one panel per quarter, however many quarters there are"""
+        groups = self._quarter_groups(self._load_quarterly_frame(data_file, sample_data))
+        return self._quarterly_figure(groups, 'Me@Sams Roadmap - Quarterly Breakdown',
+                                      max_cols=max_cols, max_items_per_quarter=max_items_per_quarter)
+    
+    def iter_quarterly_pages(self, data_file=None, sample_data=None, quarters_per_page=4, max_cols=4,
+                             max_items_per_quarter=25):
+        """Yield the quarterly breakdown one page (figure) at a time.
+        
+        Callers should save and close each page before taking the next so only
+        one canvas is alive at once, regardless of portfolio size.
+        """
+        groups = self._quarter_groups(self._load_quarterly_frame(data_file, sample_data))
+        n_pages = max(1, -(-len(groups) // quarters_per_page))
+        for page in range(n_pages):
+            chunk = groups[page * quarters_per_page:(page + 1) * quarters_per_page]
+            yield self._quarterly_figure(chunk, f'Me@Sams Roadmap - Quarterly Breakdown ({page + 1}/{n_pages})',
+                                         max_cols=max_cols, max_items_per_quarter=max_items_per_quarter)
+    
+    def _heatmap(self, ax, values, row_labels, col_labels, title, cmap):
+        """Annotated count heatmap (zeros left blank)"""
+        ax.imshow(values, cmap=cmap, aspect='auto')
+        ax.set_xticks(range(len(col_labels)))
+        ax.set_xticklabels(col_labels, rotation=45, ha='right', fontsize=8)
+        ax.set_yticks(range(len(row_labels)))
+        ax.set_yticklabels(row_labels, fontsize=8)
+        ax.set_title(title, fontsize=12, fontweight='bold')
+        threshold = values.max() / 2 if values.size else 0
+        for (r, c), value in np.ndenumerate(values):
+            if value:
+                ax.text(c, r, int(value), ha='center', va='center', fontsize=7,
+                        color='white' if value > threshold else 'black')
+    
+    def create_capacity_heatmaps(self, data_file=None, analytics=None, top_managers=20):
+        """Heatmaps of items per quarter x product group and in-flight load per product manager
+        
+        Pass precomputed ``analytics`` (roadmap_analytics) to skip loading ``data_file``.
+        """
+        if analytics is None:
+            analytics = load_analytics(data_file)
+        quarters = analytics.labels['quarter']
+        fig, (ax_groups, ax_load) = plt.subplots(1, 2, figsize=self.fig_size, gridspec_kw={'width_ratios': [1, 1]})
+        
+        by_group = analytics.by('category', 'quarter')
+        self._heatmap(ax_groups, by_group, [g or '(Blank)' for g in analytics.labels['category']], quarters,
+                      'Items per Product Group and Quarter', 'Blues')
+        
+        # Busiest managers first, by peak in-flight items in any quarter
+        active = analytics.active.T
+        order = np.argsort(-active.max(axis=1), kind='stable')[:top_managers]
+        managers = [analytics.labels['productManager'][m] or '(Unassigned)' for m in order]
+        self._heatmap(ax_load, active[order], managers, quarters,
+                      'In-flight Items per Product Manager', 'OrRd')
         
-        for i, quarter in enumerate(sorted(quarters)[:4]):
-            ax = axes[i]
-            quarter_data = df[df['quarter'] == quarter]
-            
-            # Create a simple list view for each quarter
-            y_positions = range(len(quarter_data))
-            
-            for j, (idx, row) in enumerate(quarter_data.iterrows()):
-                color = self.colors.get(quarter[-2:], '#95A5A6')
-                
-                # Create colored bar
-                ax.barh(j, 1, color=color, alpha=0.7, height=0.6)
-                
-                # Add text
-                ax.text(0.5, j, f"{row['title']}\n({row['category']})", 
-                       ha='center', va='center', fontsize=9, weight='bold')
-            
-            ax.set_xlim(0, 1)
-            ax.set_ylim(-0.5, len(quarter_data) - 0.5)
-            ax.set_title(f'{quarter}', fontsize=14, weight='bold')
-            ax.set_xticks([])
-            ax.set_yticks([])
-            
-            # Remove spines
-            for spine in ax.spines.values():
-                spine.set_visible(False)
-        
-        plt.suptitle('Me@Sams Roadmap - Quarterly Breakdown', fontsize=18, weight='bold')
-        plt.tight_layout()
+        fig.suptitle('Me@Sams Roadmap - Capacity & Load', fontsize=16, fontweight='bold')
+        fig.tight_layout(rect=(0, 0, 1, 0.95))
         return fig
 
-def main():
+def show_if_interactive():
+    """plt.show() only when a GUI backend is active, so scheduled/headless runs never block"""
+    try:
+        from matplotlib.backends import BackendFilter, backend_registry
+        interactive = backend_registry.list_builtin(BackendFilter.INTERACTIVE)
+    except ImportError:  # matplotlib < 3.9
+        interactive = rcsetup.interactive_bk
+    if plt.get_backend().lower() in {bk.lower() for bk in interactive}:
+        plt.show()
+
+def roadmap_source(excel_file, table_file):
+    """The Arrow table written by data_converter when it is at least as new as the workbook, else the workbook"""
+    try:
+        if os.path.getmtime(table_file) >= os.path.getmtime(excel_file):
+            return table_file
+    except OSError:
+        if os.path.exists(table_file) and not os.path.exists(excel_file):
+            return table_file
+    return excel_file
+
+def main(cache=None):
     """Main function to create roadmap visualizations"""
     visualizer = RoadmapVisualizer()
+    if cache is None:
+        cache = BuildCache()
     
     print("Creating Me@Sams Roadmap Visualizations...")
     
-    # Try to use the Excel file if it exists
+    # Try to use the Excel file if it exists, through data_converter's Arrow table when that is current
     excel_file = "FY26_27 Me@Sams Roadmap data file.xlsx"
+    table_file = "roadmap_data.arrow"
     
     try:
+        source = roadmap_source(excel_file, table_file) if find_spec('pyarrow') else excel_file
+        outputs = ['roadmap_timeline.png', 'roadmap_quarterly.png', 'roadmap_capacity.png']
+        # roadmap_table / schema_inference decide which columns the charts read
+        cache_key = cache.key('render', inputs=[source, __file__, quarter_parser.__file__, roadmap_analytics.__file__,
+                                                roadmap_table.__file__, schema_inference.__file__],
+                              settings=visualizer.render_settings())
+        if cache.restore(cache_key, outputs) is not None:
+            print("✓ Roadmap charts are up to date (cached), skipping render")
+            return
+        
+        # Load and normalize once; all three views draw from the same table
+        with stage('roadmap.load', source=os.path.basename(source)) as timing:
+            table = load_roadmap_table(source)
+            timing.rows = len(table)
+        print(f"Loaded {len(table)} roadmap items from {source}")
+        
         # Create timeline chart
         print("Generating timeline roadmap...")
-        timeline_fig = visualizer.create_timeline_chart(excel_file)
-        timeline_fig.savefig('roadmap_timeline.png', dpi=300, bbox_inches='tight')
+        with stage('timeline.chart'):
+            timeline_fig = visualizer.create_timeline_chart(sample_data=table)
+        with stage('timeline.savefig', dpi=visualizer.dpi):
+            timeline_fig.savefig('roadmap_timeline.png', dpi=visualizer.dpi, bbox_inches='tight')
         print("✓ Timeline roadmap saved as 'roadmap_timeline.png'")
         
         # Create quarterly view
         print("Generating quarterly breakdown...")
-        quarterly_fig = visualizer.create_quarterly_view(excel_file)
-        quarterly_fig.savefig('roadmap_quarterly.png', dpi=300, bbox_inches='tight')
+        with stage('quarterly.chart'):
+            quarterly_fig = visualizer.create_quarterly_view(sample_data=table)
+        with stage('quarterly.savefig', dpi=visualizer.dpi):
+            quarterly_fig.savefig('roadmap_quarterly.png', dpi=visualizer.dpi, bbox_inches='tight')
         print("✓ Quarterly roadmap saved as 'roadmap_quarterly.png'")
         
-        # Show the plots
-        plt.show()
+        # Create capacity heatmaps
+        print("Generating capacity heatmaps...")
+        with stage('capacity.chart'):
+            capacity_fig = visualizer.create_capacity_heatmaps(analytics=load_analytics(source, cache=cache, table=table))
+        with stage('capacity.savefig', dpi=visualizer.dpi):
+            capacity_fig.savefig('roadmap_capacity.png', dpi=visualizer.dpi, bbox_inches='tight')
+        print("✓ Capacity heatmaps saved as 'roadmap_capacity.png'")
+        cache.store(cache_key, outputs)
+        
+        # Show the plots (skipped on headless backends such as Agg)
+        show_if_interactive()
         
     except Exception as e:
         print(f"Note: Could not read Excel file directly. Error: {e}")
@@ -251,10 +444,10 @@ def main():
         
         # Create sample visualizations
         timeline_fig = visualizer.create_sample_roadmap()
-        timeline_fig.savefig('sample_roadmap_timeline.png', dpi=300, bbox_inches='tight')
+        timeline_fig.savefig('sample_roadmap_timeline.png', dpi=visualizer.dpi, bbox_inches='tight')
         
         quarterly_fig = visualizer.create_quarterly_view()
-        quarterly_fig.savefig('sample_roadmap_quarterly.png', dpi=300, bbox_inches='tight')
+        quarterly_fig.savefig('sample_roadmap_quarterly.png', dpi=visualizer.dpi, bbox_inches='tight')
         
         print("✓ Sample visualizations created")
         print("To use your actual data:")
@@ -262,7 +455,7 @@ def main():
         print("2. Ensure columns include: Title/Name, Quarter/Launch Date, Category (optional)")
         print("3. Run this script again")
         
-        plt.show()
+        show_if_interactive()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
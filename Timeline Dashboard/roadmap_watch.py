@@ -0,0 +1,288 @@
+import argparse
+import csv
+import os
+import posixpath
+import queue
+import threading
+import time
+import zipfile
+import xml.etree.ElementTree as ET
+from convert_csv import COLUMN_MAPPING, JS_FILE, iter_roadmap_items, write_roadmap_js
+from roadmap_delta import UPDATES_DIR, assign_item_ids, diff_items, publish_updates
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # fall back to polling file stats
+    Observer = None
+
+EXCEL_FILE = "FY26_27 Me@Sams Roadmap data file.xlsx"
+CSV_OUTPUT = "roadmap_data.csv"
+DEBOUNCE_SECONDS = 0.3
+POLL_SECONDS = 0.25
+
+_NS = {
+    'main': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+_REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+
+def sheet_digests(xlsx_path):
+    """{sheet name: (crc32, size)} of each worksheet part, read from the zip directory only.
+
+    Shared strings are stored once for the whole workbook, so when they change
+    every sheet is reported as changed.
+    """
+    with zipfile.ZipFile(xlsx_path) as z:
+        infos = {info.filename: (info.CRC, info.file_size) for info in z.infolist()}
+        rels = ET.fromstring(z.read('xl/_rels/workbook.xml.rels'))
+        targets = {rel.get('Id'): rel.get('Target') for rel in rels.findall('rel:Relationship', _NS)}
+        workbook = ET.fromstring(z.read('xl/workbook.xml'))
+        shared = infos.get('xl/sharedStrings.xml')
+        digests = {}
+        for sheet in workbook.findall('main:sheets/main:sheet', _NS):
+            target = targets.get(sheet.get(_REL_ID), '')
+            part = target.lstrip('/') if target.startswith('/') else posixpath.join('xl', target)
+            digests[sheet.get('name')] = (infos.get(part), shared)
+    return digests
+
+
+def load_sheet_items(path, sheets=None):
+    """{sheet: [roadmap items]} for the given sheets (all when None); CSV sources are one sheet"""
+    if not path.endswith(('.xlsx', '.xlsm')):
+        return {'': list(iter_roadmap_items(path))}
+    import pandas as pd
+    from roadmap_table import is_roadmap_export, normalize_roadmap
+
+    frames = pd.read_excel(path, sheet_name=list(sheets) if sheets is not None else None)
+    loaded = {}
+    for sheet, raw in frames.items():
+        if not is_roadmap_export(raw):
+            loaded[sheet] = []
+            continue
+        table = normalize_roadmap(raw).drop(columns='quarter_ordinal')
+        loaded[sheet] = table.astype(str).to_dict('records')
+    return loaded
+
+
+def affected_values(changes, previous, field):
+    """Values of ``field`` touched by a changeset, on both the old and the new version of each item"""
+    values = {item[field] for item in changes['added'] + changes['changed']}
+    for item_id in [item['id'] for item in changes['changed']] + changes['removed']:
+        if item_id in previous:
+            values.add(previous[item_id][field])
+    return values
+
+
+class RoadmapWatcher:
+    """Keeps the roadmap outputs current with one source file, re-ingesting only what changed"""
+
+    def __init__(self, source=EXCEL_FILE, csv_output=CSV_OUTPUT, js_output=JS_FILE,
+                 updates_dir=UPDATES_DIR, index_output=None, charts_dir=None, history_file=None,
+                 layout_output=None):
+        self.source = source
+        self.csv_output = csv_output
+        self.js_output = js_output
+        self.updates_dir = updates_dir
+        self.index_output = index_output
+        self.charts_dir = charts_dir
+        self.history_file = history_file
+        self.layout_output = layout_output
+        self.sheets = {}
+        self.digests = {}
+        self.items = {}
+        self._chart_jobs = None
+
+    def _changed_sheets(self):
+        if not self.source.endswith(('.xlsx', '.xlsm')):
+            return None, {}
+        digests = sheet_digests(self.source)
+        changed = [name for name, digest in digests.items() if self.digests.get(name) != digest]
+        return changed, digests
+
+    def refresh(self):
+        """Re-ingest changed sheets and update outputs; returns the changeset (None if nothing changed)"""
+        started = time.perf_counter()
+        changed, digests = self._changed_sheets()
+        if changed == []:
+            return None
+        loaded = load_sheet_items(self.source, changed if self.sheets else None)
+        # Unchanged sheets keep their previously parsed items, in workbook order
+        sheets = {name: loaded[name] if name in loaded else self.sheets.get(name, []) for name in digests or loaded}
+        items = [item for rows in sheets.values() for item in rows]
+        previous = self.items
+        current = {item['id']: item for item in assign_item_ids(items)}
+        changes = diff_items(previous, current)
+        self.sheets, self.digests, self.items = sheets, digests, current
+        if previous and not any(changes.values()):
+            return None
+
+        self._write_outputs(items)
+        quarters = affected_values(changes, previous, 'quarter')
+        if self.charts_dir and previous:
+            self._queue_charts(items, quarters, affected_values(changes, previous, 'category'))
+        changes['sheets'] = changed if changed is not None else ['']
+        changes['quarters'] = sorted(quarters)
+        changes['seconds'] = round(time.perf_counter() - started, 3)
+        return changes
+
+    def _write_outputs(self, items):
+        tmp = self.csv_output + '.tmp'
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMN_MAPPING.values())
+            writer.writerows([item.get(field, '') for field in COLUMN_MAPPING] for item in items)
+        os.replace(tmp, self.csv_output)
+
+        tmp = self.js_output + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            write_roadmap_js(items, f)
+        os.replace(tmp, self.js_output)
+
+        if self.updates_dir:
+            publish_updates(items, self.updates_dir)
+        if self.index_output:
+            from roadmap_store import RoadmapStore
+            with RoadmapStore() as store:
+                store.replace_items(items)
+                store.write_index_js(self.index_output)
+        if self.history_file:
+            from roadmap_history import RoadmapHistory
+            RoadmapHistory(self.history_file).append(items)
+        if self.layout_output:
+            from roadmap_layout import compute_layout, write_layout_js
+            write_layout_js(compute_layout(items), self.layout_output)
+
+    def _queue_charts(self, items, quarters, groups):
+        """Hand affected charts to the background renderer so the watch loop keeps reacting to saves"""
+        if self._chart_jobs is None:
+            self._chart_jobs = queue.Queue()
+            threading.Thread(target=self._chart_worker, daemon=True).start()
+        self._chart_jobs.put((items, set(quarters), set(groups)))
+
+    def _chart_worker(self):
+        while True:
+            items, quarters, groups = self._chart_jobs.get()
+            # Coalesce a burst of refreshes: newest items, union of everything affected
+            while True:
+                try:
+                    items, more_quarters, more_groups = self._chart_jobs.get_nowait()
+                except queue.Empty:
+                    break
+                quarters |= more_quarters
+                groups |= more_groups
+            try:
+                self.render_charts(items, quarters, groups)
+            except Exception as e:
+                print(f"⚠ Could not re-render charts: {e}")
+
+    def render_charts(self, items, quarters, groups):
+        """Re-render only the per-quarter and per-group charts whose items changed.
+
+        Charts of quarters or groups that no longer have any items are deleted.
+        """
+        import pandas as pd
+        from quarter_parser import parse_quarter_series
+        from roadmap_export import VIEWS, plan_exports, render_task, slugify
+
+        affected = {'quarter': set(quarters), 'group': {g.strip() for value in groups for g in str(value).split(',')}}
+        tasks = []
+        if items:
+            table = pd.DataFrame(items)
+            table['quarter_ordinal'] = parse_quarter_series(table['quarter'])['ordinal']
+            tasks = plan_exports(table, views=('quarter', 'group'), formats=('png',), out_dir=self.charts_dir)
+        for task in tasks:
+            if task['key'] in affected[task['view']]:
+                render_task(task, dpi=150)
+
+        current = {path for task in tasks for path in task['files']}
+        for view, keys in affected.items():
+            for key in keys:
+                path = os.path.join(self.charts_dir, VIEWS[view][0], f"{slugify(key)}.png")
+                if path not in current and os.path.exists(path):
+                    os.remove(path)
+
+
+def _poll_changes(paths, events):
+    """Polling fallback: report a path whenever its size or mtime changes"""
+    def stamp(path):
+        try:
+            st = os.stat(path)
+            return st.st_size, st.st_mtime_ns
+        except OSError:
+            return None
+    stamps = {path: stamp(path) for path in paths}
+    while True:
+        time.sleep(POLL_SECONDS)
+        for path in paths:
+            current = stamp(path)
+            if current != stamps[path]:
+                stamps[path] = current
+                events.put(path)
+
+
+def watch(source=EXCEL_FILE, debounce=DEBOUNCE_SECONDS, **outputs):
+    """Run until interrupted, refreshing outputs after each debounced burst of saves"""
+    watcher = RoadmapWatcher(source, **outputs)
+    watcher.refresh()
+    print(f"✅ Loaded {len(watcher.items)} roadmap items from {source}")
+
+    source_path = os.path.abspath(source)
+    events = queue.Queue()
+    if Observer is not None:
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Excel saves through a temp file that is renamed over the workbook
+                for path in (event.src_path, getattr(event, 'dest_path', None)):
+                    if path and os.path.abspath(path) == source_path:
+                        events.put(path)
+        observer = Observer()
+        observer.schedule(_Handler(), os.path.dirname(source_path))
+        observer.daemon = True
+        observer.start()
+        print(f"👀 Watching {source} (file system events)")
+    else:
+        threading.Thread(target=_poll_changes, args=([source_path], events), daemon=True).start()
+        print(f"👀 Watching {source} (polling every {POLL_SECONDS}s)")
+
+    while True:
+        events.get()
+        # Debounce: wait until the file has been quiet for `debounce` seconds
+        while True:
+            try:
+                events.get(timeout=debounce)
+            except queue.Empty:
+                break
+        try:
+            changes = watcher.refresh()
+        except Exception as e:
+            # Half-written or locked workbook: the next save triggers another attempt
+            print(f"⚠ Could not re-ingest {source}: {e}")
+            continue
+        if changes is None:
+            continue
+        print(f"↻ {len(changes['added'])} added, {len(changes['changed'])} changed, "
+              f"{len(changes['removed'])} removed in {changes['seconds']}s "
+              f"(quarters: {', '.join(changes['quarters']) or '-'})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch the roadmap workbook and keep CSV/JS/dashboard outputs current")
+    parser.add_argument('source', nargs='?', default=EXCEL_FILE, help="roadmap .xlsx workbook or CSV export")
+    parser.add_argument('--csv', default=CSV_OUTPUT)
+    parser.add_argument('--js', default=JS_FILE)
+    parser.add_argument('--updates', default=UPDATES_DIR, help="changeset directory for the dashboard ('' to skip)")
+    parser.add_argument('--index', help="also refresh the dashboard facet index (e.g. roadmap_index.js)")
+    parser.add_argument('--layout', help="also refresh the dashboard swimlane layout (e.g. roadmap_layout.js)")
+    parser.add_argument('--charts', metavar='DIR', help="re-render affected per-quarter/per-group charts into DIR")
+    parser.add_argument('--history', metavar='FILE', help="record each change as today's snapshot in FILE")
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS)
+    args = parser.parse_args()
+
+    try:
+        watch(args.source, debounce=args.debounce, csv_output=args.csv, js_output=args.js,
+              updates_dir=args.updates or None, index_output=args.index, charts_dir=args.charts,
+              history_file=args.history, layout_output=args.layout)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
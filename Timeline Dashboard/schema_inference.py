@@ -0,0 +1,180 @@
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
+import convert_csv
+import quarter_parser
+from convert_csv import COLUMN_MAPPING
+from quarter_parser import QUARTER_PATTERN
+
+SCHEMA_CACHE_FILE = os.path.join('.roadmap_cache', 'schema_cache.json')
+SAMPLE_ROWS = 200
+MIN_SCORE = 2.5
+
+# Role -> header keywords, most specific first. Roles use the roadmap_data.js field names.
+HEADER_KEYWORDS = {
+    'title': ['item name', 'title', 'initiative', 'feature', 'project', 'name'],
+    'quarter': ['fy qtr', 'quarter', 'qtr', 'launch', 'release', 'timeline', 'when', 'date'],
+    'category': ['product group', 'category', 'group', 'team', 'area', 'domain'],
+    'status': ['life cycle stage', 'status', 'stage', 'state', 'phase', 'progress'],
+    'priority': ['priority'],
+    'product': ['product'],
+    'itemType': ['item type', 'type'],
+    'productManager': ['product manager', 'manager', 'owner'],
+    'productLeader': ['product leader', 'leader'],
+}
+ROLE_LABELS = {
+    'title': 'Title/Name',
+    'quarter': 'Launch Quarter',
+    'category': 'Category',
+    'status': 'Status',
+    'priority': 'Priority',
+    'product': 'Product',
+    'itemType': 'Item Type',
+    'productManager': 'Product Manager',
+    'productLeader': 'Product Leader',
+}
+KNOWN_HEADERS = {header.strip().lower(): role for role, header in COLUMN_MAPPING.items()}
+PRIORITY_PATTERN = r'\(P\d\)|^P\d$'
+
+_memory_cache = {}
+
+
+@lru_cache(maxsize=None)
+def inference_version():
+    """Hash of the code and tables inference depends on; cached mappings of other versions are ignored"""
+    digest = hashlib.sha1()
+    for module_file in (__file__, quarter_parser.__file__, convert_csv.__file__):
+        with open(module_file, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def header_signature(columns):
+    """Stable key for a header row (order-sensitive, whitespace/case-insensitive)"""
+    normalized = '\x1f'.join(str(c).strip().lower() for c in columns)
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+def _header_scores(column):
+    name = re.sub(r'[\s_]+', ' ', str(column)).strip().lower()
+    scores = {}
+    if name in KNOWN_HEADERS:
+        scores[KNOWN_HEADERS[name]] = 10.0
+    for role, keywords in HEADER_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in name:
+                # Multi-word keywords are more specific than single words
+                scores[role] = max(scores.get(role, 0), 2.0 + len(keyword.split()))
+                break
+    return scores
+
+
+def _value_scores(sample):
+    """Vectorized checks over a bounded sample of one column's values"""
+    if sample.empty:
+        return {}
+    scores = {}
+    quarter_share = sample.str.match(QUARTER_PATTERN, flags=re.IGNORECASE).mean()
+    if quarter_share:
+        scores['quarter'] = 6.0 * quarter_share
+    priority_share = sample.str.contains(PRIORITY_PATTERN, regex=True).mean()
+    if priority_share:
+        scores['priority'] = 4.0 * priority_share
+    if sample.str.len().mean() > 20 and sample.nunique() > 0.9 * len(sample):
+        scores['title'] = 2.0
+    return scores
+
+
+def _match_columns(mapping, columns):
+    """Re-point a cached {role: column} at ``columns``, whose headers may differ in case/whitespace.
+
+    Returns None when a cached column has no counterpart, so the caller re-infers.
+    """
+    by_name = {str(c).strip().lower(): c for c in columns}
+    matched = {}
+    for role, column in mapping.items():
+        if column is None:
+            matched[role] = None
+            continue
+        matched[role] = by_name.get(str(column).strip().lower())
+        if matched[role] is None:
+            return None
+    return matched
+
+
+def _score_columns(df, sample_rows):
+    candidates = []
+    for column in df.columns:
+        scores = _header_scores(column)
+        series = df[column]
+        if series.dtype == object or str(series.dtype) in ('string', 'str', 'category'):
+            sample = series.head(sample_rows).dropna().astype(str).str.strip()
+            sample = sample[sample != '']
+            for role, score in _value_scores(sample).items():
+                scores[role] = scores.get(role, 0) + score
+        for role, score in scores.items():
+            candidates.append((score, role, column))
+    return candidates
+
+
+def _load_disk_cache(cache_file):
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_disk_cache(cache_file, cache):
+    os.makedirs(os.path.dirname(cache_file) or '.', exist_ok=True)
+    tmp = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+    os.replace(tmp, cache_file)
+
+
+def infer_schema(df, pinned=None, sample_rows=SAMPLE_ROWS, cache_file=SCHEMA_CACHE_FILE):
+    """Resolve roadmap roles (title, quarter, category, ...) to columns of ``df``.
+
+    Header keywords and value patterns from the first ``sample_rows`` rows
+    are scored per column. Roles are then assigned greedily by score, so
+    each column serves at most one role. ``pinned`` ({role: column}) always
+    wins. Resolved mappings are cached per header signature (in memory and in
+    ``cache_file``; pass None to skip the disk cache), so repeat runs on
+    the same export do no scanning at all. Keys include inference_version()
+    and ``sample_rows``, so a change to the scoring invalidates them.
+    Returns {role: column or None}.
+    """
+    pinned = {role: col for role, col in (pinned or {}).items() if col in df.columns}
+    version = inference_version()
+    signature = f"{version}:{sample_rows}:{header_signature(df.columns)}"
+
+    mapping = _memory_cache.get(signature)
+    if mapping is None and cache_file:
+        mapping = _load_disk_cache(cache_file).get(signature)
+    if mapping is not None:
+        # The signature ignores case and whitespace; use this frame's exact column labels
+        mapping = _match_columns(mapping, df.columns)
+    if mapping is None:
+        mapping = {role: None for role in HEADER_KEYWORDS}
+        taken = set()
+        for score, role, column in sorted(_score_columns(df, sample_rows), key=lambda c: -c[0]):
+            if score < MIN_SCORE or mapping[role] is not None or column in taken:
+                continue
+            mapping[role] = column
+            taken.add(column)
+        if cache_file:
+            # Drop mappings made by earlier versions of the inference code
+            disk = {key: value for key, value in _load_disk_cache(cache_file).items() if key.startswith(version)}
+            disk[signature] = mapping
+            _save_disk_cache(cache_file, disk)
+    _memory_cache[signature] = mapping
+
+    if not pinned:
+        return dict(mapping)
+    # Pinned columns cannot also serve another role
+    resolved = {role: (None if col in pinned.values() else col) for role, col in mapping.items()}
+    resolved.update(pinned)
+    return resolved
@@ -18,6 +18,14 @@ Write-Host ""
 Write-Host "📋 Instructions to Create Your Visual Roadmap:" -ForegroundColor Green
 Write-Host ""
 
+Write-Host "Option 0: Local Roadmap Server (live data)" -ForegroundColor Yellow
+Write-Host "1. Run: python roadmap_server.py `"$excelFile`""
+Write-Host "2. Open http://127.0.0.1:8765/ in your browser"
+Write-Host "3. Saving the Excel/CSV file reloads the data - no upload needed:"
+Write-Host "   the JSON API serves the new data right away; refresh the page to see it in the dashboard"
+Write-Host "   JSON API: /api/items?page=1&status=Live, /api/facets, /api/version"
+Write-Host ""
+
 Write-Host "Option 1: Interactive Web Dashboard (Recommended)" -ForegroundColor Yellow
 Write-Host "1. Open 'interactive_roadmap.html' in your web browser (should have opened automatically)"
 Write-Host "2. The dashboard has sample data loaded to show you how it works"
@@ -39,6 +47,13 @@ Write-Host "   - Status (Planning, In Progress, etc.)"
 Write-Host "2. Upload to the interactive dashboard"
 Write-Host ""
 
+Write-Host "Option 3: Command Line" -ForegroundColor Yellow
+Write-Host "   python roadmap_cli.py convert    # Excel workbook -> roadmap_data.csv"
+Write-Host "   python roadmap_cli.py csv2js     # timeline CSV export -> roadmap_data.js"
+Write-Host "   python roadmap_cli.py render     # static PNG charts"
+Write-Host "   python roadmap_cli.py summary    # item counts per quarter, stage and group"
+Write-Host ""
+
 Write-Host "📊 Expected Data Format:" -ForegroundColor Magenta
 Write-Host "Title,Quarter,Category,Status"
 Write-Host "Mobile App Enhancement,FY26 Q1,Technology,In Progress"